@@ -9,6 +9,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from sqlalchemy import select
+
 from physician_resolution.db.models import (
     CanonicalPhysician,
     InfluenceScore,
@@ -32,7 +34,7 @@ def seed_canonical_physicians(exports_dir: Path) -> int:
             reader = csv.DictReader(f)
             for row in reader:
                 phys = CanonicalPhysician(
-                    id=row["canonical_id"],
+                    canonical_id=row["canonical_id"],
                     npi=row["npi"] or None,
                     name=row["name"] or None,
                     specialty=row["specialty"] or None,
@@ -60,11 +62,21 @@ def seed_influence_scores(exports_dir: Path) -> int:
 
     count = 0
     with get_session() as session:
+        # Influence scores reference the surrogate pk, not the canonical_id string
+        pk_by_canonical_id = dict(
+            session.execute(select(CanonicalPhysician.canonical_id, CanonicalPhysician.pk)).all()
+        )
+
         with open(filepath) as f:
             reader = csv.DictReader(f)
             for row in reader:
+                pk = pk_by_canonical_id.get(row["canonical_id"])
+                if pk is None:
+                    logger.warning(f"Unknown canonical_id in influence scores: {row['canonical_id']}")
+                    continue
+
                 score = InfluenceScore(
-                    physician_id=row["canonical_id"],
+                    physician_id=pk,
                     pagerank_score=float(row["influence_score"])
                     if row["influence_score"]
                     else None,
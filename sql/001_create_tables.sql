@@ -21,7 +21,8 @@ CREATE TABLE IF NOT EXISTS source_records (
 
 -- Canonical physicians (resolved entities)
 CREATE TABLE IF NOT EXISTS canonical_physicians (
-    id VARCHAR(50) PRIMARY KEY,
+    pk BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    canonical_id VARCHAR(50) UNIQUE NOT NULL,
     npi VARCHAR(10),
     name VARCHAR(200),
     specialty VARCHAR(200),
@@ -37,7 +38,7 @@ CREATE TABLE IF NOT EXISTS canonical_physicians (
 -- Mapping from source records to canonical
 CREATE TABLE IF NOT EXISTS source_canonical_mapping (
     source_record_id UUID PRIMARY KEY REFERENCES source_records(id),
-    cano    cano    cano    cano NULL REFERENCES canonical_physicians(id),
+    canonical_pk BIGINT NOT NULL REFERENCES canonical_physicians(pk),
     confidence DECIMAL(4, 3),
     match_type VARCHAR(50)
 );
@@ -56,8 +57,8 @@ CREATE TABLE IF NOT EXISTS match_pairs (
 -- Referral edges
 CREATE TABLE IF NOT EXISTS referrals (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    referring_physician_id VARCHAR(50) NOT NULL REFERENCES canonical_physicians(id),
-    receiving_physician_id VARCHAR(50) NOT NULL REFERENCES canonical_physicians(id),
+    referring_physician_id BIGINT NOT NULL REFERENCES canonical_physicians(pk),
+    receiving_physician_id BIGINT NOT NULL REFERENCES canonical_physicians(pk),
     referral_count INTEGER,
     last_referral_date DATE,
     UNIQUE(referring_physician_id, receiving_physician_id)
@@ -65,7 +66,7 @@ CREATE TABLE IF NOT EXISTS referrals (
 
 -- Influence scores
 CREATE TABLE IF NOT EXISTS influence_scores (
-    physician_id VARCHAR(50) PRIMARY KEY REFERENCES canonical_physicians(id),
+    physician_id BIGINT PRIMARY KEY REFERENCES canonical_physicians(pk),
     pagerank_score DECIMAL(10, 8),
     referral_in_count INTEGER,
     referral_out_count INTEGER,
@@ -11,7 +11,7 @@ CREATE INDEX IF NOT EXISTS idx_canonical_state ON canonical_physicians(state);
 CREATE INDEX IF NOT EXISTS idx_canonical_specialty ON canonical_physicians(specialty);
 
 -- Mapping indexes
-CREATE INDEX IF NOT EXISTS idx_mapping_canonical ON source_canonical_mapping(canonical_id);
+CREATE INDEX IF NOT EXISTS idx_mapping_canonical ON source_canonical_mapping(canonical_pk);
 
 -- Match pairs indexes
 CREATE INDEX IF NOT EXISTS idx_match_pairs_source1 ON match_pairs(source_id_1);
@@ -4,7 +4,7 @@ from collections import Counter
 
 import networkx as nx
 
-from ..graph.quality import assess_cluster_quality, get_quality_summary
+from ..graph.quality import assess_all_clusters, get_quality_summary
 from ..logging import get_logger
 from ..schemas.entities import CanonicalPhysician
 
@@ -45,11 +45,8 @@ def analyze_cluster_quality(
     clusters: list[set[str]],
 ) -> dict:
     """Analyze quality metrics across all clusters."""
-    qualities = []
-
-    for idx, cluster in enumerate(clusters):
-        quality = assess_cluster_quality(G, cluster, f"CLUSTER_{idx:05d}")
-        qualities.append(quality)
+    # One whole-graph pass instead of an induced subgraph per cluster
+    qualities = assess_all_clusters(G, clusters)
 
     summary = get_quality_summary(qualities)
 
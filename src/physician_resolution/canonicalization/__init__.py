@@ -7,6 +7,7 @@ from .confidence import (
 )
 from .ids import (
     assign_canonical_ids,
+    generate_canonical_ids,
     get_canonical_id_stats,
 )
 from .merge import (
@@ -16,6 +17,7 @@ from .merge import (
 
 __all__ = [
     # ID assignment
+    "generate_canonical_ids",
     "assign_canonical_ids",
     "get_canonical_id_stats",
     # Confidence
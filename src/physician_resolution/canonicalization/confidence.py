@@ -6,6 +6,15 @@ from ..logging import get_logger
 
 logger = get_logger("canonicalization.confidence")
 
+# Base confidence by source type, hoisted to module scope - _source_confidence
+# runs once per singleton cluster
+_SOURCE_CONFIDENCE = {
+    "cms": 0.85,  # CMS has NPI, most reliable
+    "license": 0.80,  # State licenses are authoritative
+    "hospital": 0.70,  # Hospital directories vary
+    "publication": 0.50,  # Publications have abbreviated names
+}
+
 
 def calculate_entity_confidence(G: nx.Graph, cluster: set[str]) -> float:
     """
@@ -88,12 +97,18 @@ def calculate_record_confidence(
     if len(cluster) == 1:
         return 0.8  # Single record, no edges to evaluate
 
-    # Get edges connecting this record to others in cluster
-    edge_weights = []
-    for other_id in cluster:
-        if other_id != source_id and G.has_edge(source_id, other_id):
-            weight = G[source_id][other_id].get("weight", 0.5)
-            edge_weights.append(weight)
+    # Get edges connecting this record to others in cluster. Iterate whichever
+    # of (neighbors, cluster) is smaller - degree is usually far below cluster
+    # size in sparse identity graphs.
+    nbrs = G.adj[source_id]
+    if len(nbrs) < len(cluster):
+        edge_weights = [
+            d.get("weight", 0.5) for v, d in nbrs.items() if v != source_id and v in cluster
+        ]
+    else:
+        edge_weights = [
+            nbrs[v].get("weight", 0.5) for v in cluster if v != source_id and v in nbrs
+        ]
 
     if not edge_weights:
         # Not directly connected to any cluster member
@@ -111,35 +126,34 @@ def calculate_record_confidence(
 
 def _source_confidence(source: str) -> float:
     """Base confidence by source type."""
-    confidence_map = {
-        "cms": 0.85,  # CMS has NPI, most reliable
-        "license": 0.80,  # State licenses are authoritative
-        "hospital": 0.70,  # Hospital directories vary
-        "publication": 0.50,  # Publications have abbreviated names
-    }
-    return confidence_map.get(source, 0.5)
+    return _SOURCE_CONFIDENCE.get(source, 0.5)
 
 
 def calculate_all_confidences(
     G: nx.Graph,
     clusters: list[set[str]],
+    canonical_ids: list[str] | None = None,
 ) -> tuple[dict[str, float], dict[str, float]]:
     """
     Calculate entity and record confidences for all clusters.
 
+    Pass precomputed canonical_ids (from generate_canonical_ids) to avoid
+    re-deriving them per cluster.
+
     Returns:
         (entity_confidences, record_confidences)
         - entity_confidences: canonical_id -> confidence
         - record_confidences: source_id -> confidence
     """
-    from .ids import _generate_canonical_id
+    if canonical_ids is None:
+        from .ids import generate_canonical_ids
+
+        canonical_ids = generate_canonical_ids(G, clusters)
 
     entity_confidences: dict[str, float] = {}
     record_confidences: dict[str, float] = {}
 
-    for cluster in clusters:
-        canonical_id = _generate_canonical_id(G, cluster)
-
+    for cluster, canonical_id in zip(clusters, canonical_ids):
         # Entity confidence
         entity_conf = calculate_entity_confidence(G, cluster)
         entity_confidences[canonical_id] = entity_conf
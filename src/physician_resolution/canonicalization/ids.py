@@ -10,9 +10,21 @@ from ..logging import get_logger
 logger = get_logger("canonicalization.ids")
 
 
+def generate_canonical_ids(G: nx.Graph, clusters: list[set[str]]) -> list[str]:
+    """
+    Generate one canonical ID per cluster.
+
+    Compute this once and pass the result to assign_canonical_ids,
+    merge_all_clusters, and calculate_all_confidences so each cluster is
+    scanned for NPIs a single time.
+    """
+    return [_generate_canonical_id(G, cluster) for cluster in clusters]
+
+
 def assign_canonical_ids(
     G: nx.Graph,
     clusters: list[set[str]],
+    canonical_ids: list[str] | None = None,
 ) -> dict[str, str]:
     """
     Assign a canonical_physician_id to each cluster.
@@ -26,11 +38,12 @@ def assign_canonical_ids(
     Returns:
         Dict mapping source_id -> canonical_id
     """
-    mapping: dict[str, str] = {}
+    if canonical_ids is None:
+        canonical_ids = generate_canonical_ids(G, clusters)
 
-    for cluster in clusters:
-        canonical_id = _generate_canonical_id(G, cluster)
+    mapping: dict[str, str] = {}
 
+    for cluster, canonical_id in zip(clusters, canonical_ids):
         for source_id in cluster:
             mapping[source_id] = canonical_id
 
@@ -49,9 +62,12 @@ def _generate_canonical_id(G: nx.Graph, cluster: set[str]) -> str:
             npis.append(npi)
 
     if npis:
-        # Use most common NPI
-        npi_counts = Counter(npis)
-        most_common_npi = npi_counts.most_common(1)[0][0]
+        # Use most common NPI. Most clusters carry very few distinct NPIs,
+        # where a direct scan beats building a Counter.
+        if len(npis) < 4:
+            most_common_npi = max(set(npis), key=npis.count)
+        else:
+            most_common_npi = Counter(npis).most_common(1)[0][0]
         return f"PHY_{most_common_npi}"
     else:
         # Generate UUID
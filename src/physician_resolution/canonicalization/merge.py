@@ -23,6 +23,7 @@ SOURCE_PRIORITY = {
 def merge_cluster_attributes(
     G: nx.Graph,
     cluster: set[str],
+    canonical_id: str | None = None,
 ) -> CanonicalPhysician:
     """
     Combine attributes from all records in cluster into a canonical entity.
@@ -32,8 +33,11 @@ def merge_cluster_attributes(
     - Name: Longest/most complete, prefer higher-priority sources
     - Specialty: Most common, prefer CMS
     - Location: Most recent or most frequent facility
+
+    Pass a precomputed canonical_id to avoid re-scanning the cluster.
     """
-    canonical_id = _generate_canonical_id(G, cluster)
+    if canonical_id is None:
+        canonical_id = _generate_canonical_id(G, cluster)
     confidence = calculate_entity_confidence(G, cluster)
 
     # Collect all attributes
@@ -103,9 +107,10 @@ def _select_npi(npis: list[str]) -> str | None:
     if not valid_npis:
         return None
 
-    # Most common
-    counts = Counter(valid_npis)
-    return counts.most_common(1)[0][0]
+    # Most common - tiny lists are cheaper to scan than to Counter
+    if len(valid_npis) < 4:
+        return max(set(valid_npis), key=valid_npis.count)
+    return Counter(valid_npis).most_common(1)[0][0]
 
 
 def _select_name(names: list[tuple[str, int, str]]) -> str | None:
@@ -185,12 +190,16 @@ def _select_most_common(values: list[str]) -> str | None:
 def merge_all_clusters(
     G: nx.Graph,
     clusters: list[set[str]],
+    canonical_ids: list[str] | None = None,
 ) -> list[CanonicalPhysician]:
     """Merge all clusters into canonical physicians."""
+    if canonical_ids is None:
+        canonical_ids = [None] * len(clusters)
+
     physicians = []
 
-    for cluster in clusters:
-        physician = merge_cluster_attributes(G, cluster)
+    for cluster, canonical_id in zip(clusters, canonical_ids):
+        physician = merge_cluster_attributes(G, cluster, canonical_id)
         physicians.append(physician)
 
     logger.info(f"Created {len(physicians)} canonical physicians")
@@ -19,6 +19,9 @@ class PipelineConfig:
     prune_npi_conflicts: bool = True
     use_soundex_blocking: bool = True
     include_uncertain_matches: bool = False
+    # Worker processes for parallel pair scoring; None lets the pool size
+    # itself to the machine (os.cpu_count())
+    n_workers: int | None = None
 
     @classmethod
     def from_env(cls) -> "PipelineConfig":
@@ -28,6 +31,7 @@ class PipelineConfig:
             non_match_threshold=float(os.getenv("NON_MATCH_THRESHOLD", "0.30")),
             min_edge_weight=float(os.getenv("MIN_EDGE_WEIGHT", "0.40")),
             max_cluster_size=int(os.getenv("MAX_CLUSTER_SIZE", "100")),
+            n_workers=int(os.environ["N_WORKERS"]) if os.getenv("N_WORKERS") else None,
         )
 
 
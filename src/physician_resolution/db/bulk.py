@@ -1,3 +1,5 @@
+import logging
+
 from sqlalchemy import insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -9,6 +11,11 @@ from .session import get_engine
 logger = get_logger("db.bulk")
 
 
+def _should_log_batch(batch_no: int) -> bool:
+    """Log at doubling intervals (batches 0, 1, 2, 4, 8, ...) - O(log N) lines."""
+    return batch_no & (batch_no - 1) == 0
+
+
 def _record_to_row(r: PhysicianRecord) -> dict:
     return {
         "source": r.source,
@@ -36,17 +43,20 @@ def bulk_insert_source_records(records: list[PhysicianRecord], batch_size: int =
     engine = get_engine()
     total_inserted = 0
 
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        rows = [_record_to_row(r) for r in batch]
+    # Single transaction for the whole load - one commit/fsync instead of
+    # one per batch
+    with engine.begin() as conn:
+        for i in range(0, len(records), batch_size):
+            batch = records[i : i + batch_size]
+            rows = [_record_to_row(r) for r in batch]
 
-        with engine.connect() as conn:
             conn.execute(insert(SourceRecord), rows)
-            conn.commit()
 
-        total_inserted += len(batch)
-        logger.info(f"Inserted batch: {total_inserted}/{len(records)} records")
+            total_inserted += len(batch)
+            if _should_log_batch(i // batch_size) and logger.isEnabledFor(logging.INFO):
+                logger.info(f"Inserted batch: {total_inserted}/{len(records)} records")
 
+    logger.info(f"Inserted {total_inserted} records")
     return total_inserted
 
 
@@ -58,34 +68,35 @@ def bulk_upsert_source_records(records: list[PhysicianRecord], batch_size: int =
     engine = get_engine()
     total_upserted = 0
 
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        rows = [_record_to_row(r) for r in batch]
-
-        stmt = pg_insert(SourceRecord).values(rows)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["source", "source_id"],
-            set_={
-                "npi": stmt.excluded.npi,
-                "name_raw": stmt.excluded.name_raw,
-                "name_first": stmt.excluded.name_first,
-                "name_last": stmt.excluded.name_last,
-                "name_middle": stmt.excluded.name_middle,
-                "specialty": stmt.excluded.specialty,
-                "facility_name": stmt.excluded.facility_name,
-                "facility_city": stmt.excluded.facility_city,
-                "facility_state": stmt.excluded.facility_state,
-                "facility_zip": stmt.excluded.facility_zip,
-                "latitude": stmt.excluded.latitude,
-                "longitude": stmt.excluded.longitude,
-            },
-        )
-
-        with engine.connect() as conn:
+    with engine.begin() as conn:
+        for i in range(0, len(records), batch_size):
+            batch = records[i : i + batch_size]
+            rows = [_record_to_row(r) for r in batch]
+
+            stmt = pg_insert(SourceRecord).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "source_id"],
+                set_={
+                    "npi": stmt.excluded.npi,
+                    "name_raw": stmt.excluded.name_raw,
+                    "name_first": stmt.excluded.name_first,
+                    "name_last": stmt.excluded.name_last,
+                    "name_middle": stmt.excluded.name_middle,
+                    "specialty": stmt.excluded.specialty,
+                    "facility_name": stmt.excluded.facility_name,
+                    "facility_city": stmt.excluded.facility_city,
+                    "facility_state": stmt.excluded.facility_state,
+                    "facility_zip": stmt.excluded.facility_zip,
+                    "latitude": stmt.excluded.latitude,
+                    "longitude": stmt.excluded.longitude,
+                },
+            )
+
             conn.execute(stmt)
-            conn.commit()
 
-        total_upserted += len(batch)
-        logger.info(f"Upserted batch: {total_upserted}/{len(records)} records")
+            total_upserted += len(batch)
+            if _should_log_batch(i // batch_size) and logger.isEnabledFor(logging.INFO):
+                logger.info(f"Upserted batch: {total_upserted}/{len(records)} records")
 
+    logger.info(f"Upserted {total_upserted} records")
     return total_upserted
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy import BigInteger, Float, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,9 +17,9 @@ class SourceCanonicalMapping(Base):
         ForeignKey("source_records.id"),
         primary_key=True,
     )
-    canonical_id: Mapped[str] = mapped_column(
-        String(50),
-        ForeignKey("canonical_physicians.id"),
+    canonical_pk: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("canonical_physicians.pk"),
         nullable=False,
     )
     confidence: Mapped[float | None] = mapped_column(Float)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import BigInteger, Date, DateTime, Float, ForeignKey, Integer, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,14 +14,14 @@ class Referral(Base):
     __tablename__ = "referrals"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    referring_physician_id: Mapped[str] = mapped_column(
-        String(50),
-        ForeignKey("canonical_physicians.id"),
+    referring_physician_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("canonical_physicians.pk"),
         nullable=False,
     )
-    receiving_physician_id: Mapped[str] = mapped_column(
-        String(50),
-        ForeignKey("canonical_physicians.id"),
+    receiving_physician_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("canonical_physicians.pk"),
         nullable=False,
     )
     referral_count: Mapped[int | None] = mapped_column(Integer)
@@ -33,9 +33,9 @@ class InfluenceScore(Base):
 
     __tablename__ = "influence_scores"
 
-    physician_id: Mapped[str] = mapped_column(
-        String(50),
-        ForeignKey("canonical_physicians.id"),
+    physician_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("canonical_physicians.pk"),
         primary_key=True,
     )
     pagerank_score: Mapped[float | None] = mapped_column(Float)
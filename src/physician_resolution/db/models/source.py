@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, String, func
+from sqlalchemy import DateTime, Float, Index, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,13 @@ class SourceRecord(Base):
     """Raw ingested physician record from a data source."""
 
     __tablename__ = "source_records"
+    __table_args__ = (
+        # Matches sql/001_create_tables.sql; bulk_upsert_source_records targets
+        # this constraint with ON CONFLICT (source, source_id)
+        UniqueConstraint("source", "source_id", name="uq_source_records_source_source_id"),
+        Index("idx_source_records_npi", "npi"),
+        Index("idx_source_records_last_state", "name_last", "facility_state"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source: Mapped[str] = mapped_column(String(50), nullable=False)
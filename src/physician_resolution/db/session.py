@@ -11,11 +11,33 @@ _engine = None
 _session_factory = None
 
 
+def _engine_kwargs(url: str) -> dict:
+    """Build driver-specific create_engine kwargs for bulk workloads."""
+    kwargs: dict = {"echo": False}
+
+    if not url.startswith("postgresql"):
+        return kwargs
+
+    # Connection pool tuned for concurrent bulk loads
+    kwargs["pool_size"] = 10
+    kwargs["pool_pre_ping"] = True
+
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        # psycopg2: rewrite executemany into batched multi-VALUES statements
+        # so each batch is one round-trip instead of one per row
+        kwargs["executemany_mode"] = "values_plus_batch"
+        kwargs["executemany_values_page_size"] = 1000
+    # psycopg3 uses SQLAlchemy's insertmanyvalues batching by default
+
+    return kwargs
+
+
 def get_engine():
     """Get or create the database engine."""
     global _engine
     if _engine is None:
-        _engine = create_engine(get_database_url(), echo=False)
+        url = get_database_url()
+        _engine = create_engine(url, **_engine_kwargs(url))
     return _engine
 
 
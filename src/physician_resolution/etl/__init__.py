@@ -1,6 +1,16 @@
 """ETL module for loading and normalizing physician data."""
 
-from .geocoder import calculate_distance_miles, geocode_zip, locations_nearby
+from .geocoder import (
+    SpatialIndex,
+    build_spatial_index,
+    calculate_distance_miles,
+    calculate_distance_miles_vec,
+    geocode_zip,
+    geocode_zip_series,
+    haversine_precomputed_vec,
+    locations_nearby,
+    precompute_trig,
+)
 from .loaders import (
     load_all_sources,
     load_cms_claims,
@@ -17,7 +27,9 @@ from .normalizer import (
     normalize_hospital_affiliations,
     normalize_publications,
     normalize_state_licenses,
+    stream_normalized_records,
 )
+from .record_cache import normalize_all_cached
 
 __all__ = [
     # Loaders
@@ -33,12 +45,20 @@ __all__ = [
     "standardize_name",
     # Normalizers
     "normalize_all",
+    "normalize_all_cached",
     "normalize_cms_claims",
     "normalize_hospital_affiliations",
     "normalize_publications",
     "normalize_state_licenses",
+    "stream_normalized_records",
     # Geocoding
     "geocode_zip",
+    "geocode_zip_series",
     "calculate_distance_miles",
+    "calculate_distance_miles_vec",
+    "precompute_trig",
+    "haversine_precomputed_vec",
     "locations_nearby",
+    "SpatialIndex",
+    "build_spatial_index",
 ]
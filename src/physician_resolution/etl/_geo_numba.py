@@ -0,0 +1,40 @@
+"""Optional Numba-compiled Haversine kernel.
+
+Numba is not a required dependency. When it is installed, haversine_miles is
+a compiled parallel ufunc that fuses the per-element trig with no temporary
+arrays; otherwise it is None and callers fall back to the NumPy kernel.
+"""
+
+import math
+
+EARTH_RADIUS_MILES = 3959.0
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+if numba is not None:
+
+    @numba.vectorize(
+        ["float64(float64, float64, float64, float64)"],
+        target="parallel",
+        fastmath=True,
+        cache=True,
+    )
+    def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        delta_lat = math.radians(lat2 - lat1)
+        delta_lon = math.radians(lon2 - lon1)
+
+        a = (
+            math.sin(delta_lat / 2) ** 2
+            + math.cos(math.radians(lat1))
+            * math.cos(math.radians(lat2))
+            * math.sin(delta_lon / 2) ** 2
+        )
+        # 2*asin(sqrt(a)) is equivalent to 2*atan2(sqrt(a), sqrt(1-a))
+        # with one fewer transcendental
+        return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+else:
+    haversine_miles = None
@@ -3,16 +3,30 @@
 import math
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 
 from ..config import REFERENCE_DIR
 from ..logging import get_logger
+from ._geo_numba import haversine_miles as _haversine_miles_numba
 
 logger = get_logger("etl.geocoder")
 
+# Earth radius in miles
+EARTH_RADIUS_MILES = 3959
+
 # In-memory cache of zip centroids
 _zip_cache: dict[str, tuple[float, float]] = {}
 
+# Prefix index for zip3 fallback - maps first 3 digits to the first centroid
+# sharing that prefix, so misses don't linearly scan the whole cache
+_zip3_cache: dict[str, tuple[float, float]] = {}
+
+# DataFrame views of the caches (zip-indexed), built lazily for merge joins
+_zip_df: pd.DataFrame | None = None
+_zip3_df: pd.DataFrame | None = None
+
 # Approximate centroids for cities used in synthetic data
 # In production, you'd load from a real zip centroid file
 DEFAULT_CENTROIDS = {
@@ -74,9 +88,28 @@ def load_zip_centroids(filepath: Path | None = None) -> dict[str, tuple[float, f
         _zip_cache = DEFAULT_CENTROIDS.copy()
         logger.info(f"Using {len(_zip_cache)} default zip centroids")
 
+    for z, coords in _zip_cache.items():
+        _zip3_cache.setdefault(z[:3], coords)
+
     return _zip_cache
 
 
+def load_zip_centroids_df() -> pd.DataFrame:
+    """Zip centroids as a DataFrame indexed by zip, for merge-style joins."""
+    global _zip_df, _zip3_df
+
+    if _zip_df is None:
+        centroids = load_zip_centroids()
+        _zip_df = pd.DataFrame.from_dict(
+            centroids, orient="index", columns=["latitude", "longitude"]
+        )
+        _zip3_df = pd.DataFrame.from_dict(
+            _zip3_cache, orient="index", columns=["latitude", "longitude"]
+        )
+
+    return _zip_df
+
+
 def geocode_zip(zip_code: str | None) -> tuple[float | None, float | None]:
     """Get lat/lon for a zip code."""
     if not zip_code:
@@ -91,12 +124,33 @@ def geocode_zip(zip_code: str | None) -> tuple[float | None, float | None]:
         return centroids[zip_code]
 
     # Try matching just the first 3 digits (zip3)
-    zip3 = zip_code[:3]
-    for z, coords in centroids.items():
-        if z.startswith(zip3):
-            return coords
+    return _zip3_cache.get(zip_code[:3], (None, None))
+
+
+def geocode_zip_series(zips: pd.Series) -> pd.DataFrame:
+    """
+    Geocode a whole Series of zip codes at once.
 
-    return None, None
+    Normalization and lookup are vectorized; returns a DataFrame with
+    'latitude'/'longitude' columns aligned to the input index. Unresolvable
+    zips get NaN.
+    """
+    zip_df = load_zip_centroids_df()
+
+    zip5 = zips.astype("string").str.strip().str.slice(0, 5).str.zfill(5)
+
+    # One hash join against the centroid table instead of per-column maps
+    coords = zip_df.reindex(zip5.astype(object))
+    coords.index = zips.index
+
+    # zip3 prefix fallback for misses, joined the same way
+    missing = coords["latitude"].isna()
+    if missing.any():
+        fallback = _zip3_df.reindex(zip5[missing].str[:3].astype(object))
+        fallback.index = coords.index[missing]
+        coords = coords.fillna(fallback)
+
+    return coords.astype(float)
 
 
 def calculate_distance_miles(
@@ -109,8 +163,12 @@ def calculate_distance_miles(
     if any(x is None for x in [lat1, lon1, lat2, lon2]):
         return None
 
-    # Earth radius in miles
-    R = 3959
+    # Records geocoded to the same facility share exact coordinates; skip
+    # the six transcendental calls for that common case
+    if lat1 == lat2 and lon1 == lon2:
+        return 0.0
+
+    R = EARTH_RADIUS_MILES
 
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
@@ -121,9 +179,75 @@ def calculate_distance_miles(
         math.sin(delta_lat / 2) ** 2
         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # 2*asin(sqrt(a)) == 2*atan2(sqrt(a), sqrt(1-a)), one fewer transcendental
+    return 2 * R * math.asin(math.sqrt(a))
+
+
+def calculate_distance_miles_vec(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized Haversine over NumPy arrays, in miles.
+
+    Elements with NaN coordinates yield NaN. Use this instead of calling
+    calculate_distance_miles in a Python loop when scoring many pairs.
+    """
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+
+    if _haversine_miles_numba is not None:
+        return _haversine_miles_numba(lat1, lon1, lat2, lon2)
+
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lon = np.radians(lon2 - lon1)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(delta_lon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+
+def precompute_trig(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precompute (lat_rad, cos_lat, lon_rad) columns for haversine_precomputed_vec.
 
-    return R * c
+    Compute these once per record set; float32 halves the bandwidth and its
+    precision error is far below any locations_nearby threshold in miles.
+    """
+    lat_rad = np.radians(np.asarray(latitudes, dtype=np.float32))
+    lon_rad = np.radians(np.asarray(longitudes, dtype=np.float32))
+    return lat_rad, np.cos(lat_rad), lon_rad
+
+
+def haversine_precomputed_vec(
+    a_lat_rad: np.ndarray,
+    a_cos_lat: np.ndarray,
+    a_lon_rad: np.ndarray,
+    b_lat_rad: np.ndarray,
+    b_cos_lat: np.ndarray,
+    b_lon_rad: np.ndarray,
+) -> np.ndarray:
+    """
+    Haversine over precomputed trig columns, in miles.
+
+    When many queries hit the same candidate set, radians and cos(lat) are
+    computed once by precompute_trig instead of once per query, leaving just
+    two sin calls and one arcsin per pair here.
+    """
+    delta_lat = b_lat_rad - a_lat_rad
+    delta_lon = b_lon_rad - a_lon_rad
+
+    a = np.sin(delta_lat * 0.5) ** 2 + a_cos_lat * b_cos_lat * np.sin(delta_lon * 0.5) ** 2
+    return (2 * EARTH_RADIUS_MILES) * np.arcsin(np.sqrt(a))
 
 
 def locations_nearby(
@@ -138,3 +262,46 @@ def locations_nearby(
     if distance is None:
         return False
     return distance <= threshold_miles
+
+
+def _unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Project lat/lon degrees onto 3D points on the unit sphere."""
+    lat_rad = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))
+    )
+
+
+class SpatialIndex:
+    """
+    KD-tree over record coordinates for radius queries.
+
+    Answers "which records lie within R miles of a point" in O(log N) per
+    query instead of one Haversine call per record. Coordinates are embedded
+    on the unit sphere so Euclidean (chord) distance in the tree corresponds
+    exactly to great-circle distance; rows with missing coordinates are
+    excluded and never returned.
+    """
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        valid = np.isfinite(latitudes) & np.isfinite(longitudes)
+        self._positions = np.flatnonzero(valid)
+        self._tree = cKDTree(_unit_vectors(latitudes[valid], longitudes[valid]))
+
+    def nearby_indices(self, latitude: float, longitude: float, miles: float) -> np.ndarray:
+        """Return positions (into the original arrays) within miles of a point."""
+        # Chord length on the unit sphere subtending the great-circle radius
+        chord = 2 * math.sin(miles / (2 * EARTH_RADIUS_MILES))
+        point = _unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+        hits = self._tree.query_ball_point(point, chord)
+        return self._positions[np.asarray(hits, dtype=np.int64)]
+
+
+def build_spatial_index(latitudes: np.ndarray, longitudes: np.ndarray) -> SpatialIndex:
+    """Build a spatial index over record coordinates (see SpatialIndex)."""
+    return SpatialIndex(latitudes, longitudes)
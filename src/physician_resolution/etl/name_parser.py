@@ -1,9 +1,10 @@
 """Parse and standardize physician names."""
 
+import functools
 import re
 
 from ..logging import get_logger
-from ..schemas.records import ParsedName
+from ..schemas.records import ParsedName, normalize_name_token
 
 logger = get_logger("etl.name_parser")
 
@@ -44,11 +45,35 @@ SUFFIX_PATTERN = re.compile(
     r",?\s*(" + "|".join(re.escape(s) for s in SUFFIXES) + r")\.?\s*$", re.IGNORECASE
 )
 
+# Suffix spellings for a cheap endswith prefilter that skips the alternation
+# regex when the name can't possibly end in a suffix (the common case)
+_SUFFIX_ENDINGS = tuple({s.upper() for s in SUFFIXES})
 
+
+def _ends_with_suffix_token(name: str) -> bool:
+    """
+    Cheap check whether the end of the name could match SUFFIX_PATTERN.
+
+    Deliberately conservative: SUFFIX_PATTERN has no leading word boundary,
+    so a suffix embedded at token end (e.g. "ENMD") must still reach the
+    regex, which makes the final call. False positives here only cost one
+    regex search.
+    """
+    tail = name.rstrip().upper()
+    if tail.endswith(_SUFFIX_ENDINGS):
+        return True
+    # The regex also allows one trailing period after the suffix spelling
+    return tail.endswith(".") and tail[:-1].endswith(_SUFFIX_ENDINGS)
+
+
+@functools.lru_cache(maxsize=1 << 18)
 def parse_name(raw_name: str) -> ParsedName:
     """
     Parse a raw name string into components.
 
+    Results are memoized - the same provider name appears on many claim
+    rows, so repeat parses are dict hits.
+
     Handles:
     - LAST, FIRST format (CMS style)
     - FIRST LAST format
@@ -66,7 +91,7 @@ def parse_name(raw_name: str) -> ParsedName:
 
     # Extract suffix(es)
     suffixes_found = []
-    while True:
+    while name and _ends_with_suffix_token(name):
         match = SUFFIX_PATTERN.search(name)
         if match:
             suffixes_found.append(match.group(1).upper().replace(".", ""))
@@ -77,13 +102,12 @@ def parse_name(raw_name: str) -> ParsedName:
     if suffixes_found:
         suffix = ", ".join(reversed(suffixes_found))
 
-    # Remove title
-    name_upper = name.upper()
-    for t in TITLES:
-        if name_upper.startswith(t + " "):
-            title = t.replace(".", "")
-            name = name[len(t) :].strip()
-            break
+    # Remove title - leading token is matched against the title set in one
+    # probe instead of one startswith per title
+    first_token, sep, rest = name.partition(" ")
+    if sep and first_token.upper() in TITLES:
+        title = first_token.upper().replace(".", "")
+        name = rest.strip()
 
     # Clean up extra whitespace
     name = " ".join(name.split())
@@ -192,10 +216,7 @@ def names_match_fuzzy(name1: str, name2: str) -> bool:
     if not p1.last or not p2.last:
         return False
 
-    last1 = p1.last.upper().replace("-", "").replace("'", "").replace(" ", "")
-    last2 = p2.last.upper().replace("-", "").replace("'", "").replace(" ", "")
-
-    if last1 != last2:
+    if normalize_name_token(p1.last) != normalize_name_token(p2.last):
         return False
 
     # Check first name compatibility
@@ -1,64 +1,113 @@
 """Normalize source data into PhysicianRecord objects."""
 
 import hashlib
+from collections.abc import Iterator
+from pathlib import Path
 
 import pandas as pd
 
 from ..logging import get_logger
 from ..schemas.records import PhysicianRecord
-from .geocoder import geocode_zip
+from .geocoder import geocode_zip_series
 from .name_parser import parse_name
 
 logger = get_logger("etl.normalizer")
 
 
-def _generate_source_id(source: str, row: pd.Series, index: int) -> str:
-    """Generate a unique source ID for a record."""
+def _get(row, column: str, default=None):
+    """Fetch a column from an itertuples row, tolerating missing columns."""
+    return getattr(row, column, default)
 
-    # Use source_id from CSV if present
-    if "source_id" in row and pd.notna(row.get("source_id")):
-        return str(row["source_id"])
 
-    # Use a hash of key fields to create stable IDs
-    if source == "cms" and pd.notna(row.get("npi")):
-        key = f"cms_{row['npi']}_{row.get('procedure_date', '')}_{index}"
+def _get_str(row, column: str) -> str | None:
+    """Fetch a string column, mapping NaN/missing to None."""
+    value = getattr(row, column, None)
+    return value if isinstance(value, str) else None
+
+
+def _clean_npi_column(df: pd.DataFrame, drop_placeholder: bool = False) -> list[str | None]:
+    """
+    Vectorized NPI cleaning for a whole DataFrame.
+
+    Blank/missing NPIs become None; with drop_placeholder, values containing
+    'X' (masked NPIs in CMS extracts) are dropped too.
+    """
+    if "npi" not in df.columns:
+        return [None] * len(df)
+
+    npi = df["npi"].astype("string")
+    valid = npi.notna() & (npi != "")
+    if drop_placeholder:
+        valid &= ~npi.str.contains("X")
+
+    return [n if ok else None for n, ok in zip(npi, valid)]
+
+
+def _generate_source_ids(source: str, df: pd.DataFrame) -> list[str]:
+    """
+    Generate stable source IDs for a whole DataFrame.
+
+    Key strings are built with vectorized column concatenation; only the
+    md5 digest runs per row.
+    """
+    index_str = df.index.astype(str)
+
+    def col(name: str, default: str = "") -> pd.Series:
+        if name in df.columns:
+            return df[name].astype(str)
+        return pd.Series(default, index=df.index)
+
+    if source == "cms":
+        keys = "cms_" + col("npi") + "_" + col("procedure_date") + "_" + index_str
+        # Rows without an NPI fall back to the plain index key
+        has_npi = df["npi"].notna() if "npi" in df.columns else pd.Series(False, index=df.index)
+        keys = keys.where(has_npi, "cms_" + index_str)
     elif source == "license":
-        key = f"license_{row.get('license_number', index)}"
+        if "license_number" in df.columns:
+            keys = "license_" + col("license_number")
+        else:
+            keys = "license_" + index_str
     elif source == "hospital":
-        key = f"hospital_{row.get('hospital_id', '')}_{row.get('physician_name', '')}_{index}"
+        keys = "hospital_" + col("hospital_id") + "_" + col("physician_name") + "_" + index_str
     elif source == "publication":
-        key = f"pub_{row.get('publication_id', '')}_{row.get('author_name', '')}_{index}"
+        keys = "pub_" + col("publication_id") + "_" + col("author_name") + "_" + index_str
     else:
-        key = f"{source}_{index}"
+        keys = source + "_" + index_str
+
+    hashed = [hashlib.md5(k.encode()).hexdigest()[:16] for k in keys]
 
-    return hashlib.md5(key.encode()).hexdigest()[:16]
+    # A source_id column in the CSV takes precedence over generated hashes
+    if "source_id" in df.columns:
+        return [str(s) if pd.notna(s) else h for s, h in zip(df["source_id"], hashed)]
+    return hashed
 
 
 def normalize_cms_claims(df: pd.DataFrame) -> list[PhysicianRecord]:
     """Normalize CMS claims data."""
     records = []
 
-    for idx, row in df.iterrows():
-        parsed = parse_name(row.get("provider_name", ""))
+    # Vectorized column cleaning; the row loop only does name parsing
+    npis = _clean_npi_column(df, drop_placeholder=True)
+    source_ids = _generate_source_ids("cms", df)
+
+    for row, npi, source_id in zip(df.itertuples(index=False), npis, source_ids):
+        name_raw = _get_str(row, "provider_name")
+        parsed = parse_name(name_raw or "")
 
         # Geocode based on facility (we don't have direct address in CMS)
         lat, lon = None, None
 
-        npi = row.get("npi")
-        if pd.isna(npi) or not npi or "X" in str(npi):
-            npi = None
-
         record = PhysicianRecord(
             source="cms",
-            source_id=_generate_source_id("cms", row, idx),
+            source_id=source_id,
             npi=npi,
-            name_raw=row.get("provider_name"),
+            name_raw=name_raw,
             name_first=parsed.first,
             name_last=parsed.last,
             name_middle=parsed.middle,
             name_suffix=parsed.suffix,
-            specialty=row.get("provider_specialty"),
-            facility_name=row.get("facility_name"),
+            specialty=_get_str(row, "provider_specialty"),
+            facility_name=_get_str(row, "facility_name"),
             latitude=lat,
             longitude=lon,
         )
@@ -72,27 +121,39 @@ def normalize_state_licenses(df: pd.DataFrame) -> list[PhysicianRecord]:
     """Normalize state license data."""
     records = []
 
-    for idx, row in df.iterrows():
-        parsed = parse_name(row.get("physician_name", ""))
+    source_ids = _generate_source_ids("license", df)
+
+    # Geocode the whole zip column at once
+    if "address_zip" in df.columns:
+        coords = geocode_zip_series(df["address_zip"])
+        latitudes = [v if pd.notna(v) else None for v in coords["latitude"]]
+        longitudes = [v if pd.notna(v) else None for v in coords["longitude"]]
+    else:
+        latitudes = [None] * len(df)
+        longitudes = [None] * len(df)
+
+    for row, source_id, lat, lon in zip(
+        df.itertuples(index=False), source_ids, latitudes, longitudes
+    ):
+        name_raw = _get_str(row, "physician_name")
+        parsed = parse_name(name_raw or "")
 
-        # Geocode from zip
-        zip_code = row.get("address_zip")
-        lat, lon = geocode_zip(zip_code) if pd.notna(zip_code) else (None, None)
+        zip_code = _get_str(row, "address_zip")
 
         record = PhysicianRecord(
             source="license",
-            source_id=_generate_source_id("license", row, idx),
+            source_id=source_id,
             npi=None,  # Licenses don't have NPI
-            name_raw=row.get("physician_name"),
+            name_raw=name_raw,
             name_first=parsed.first,
             name_last=parsed.last,
             name_middle=parsed.middle,
             name_suffix=parsed.suffix,
-            specialty=row.get("specialty"),
+            specialty=_get_str(row, "specialty"),
             facility_name=None,
-            facility_address=row.get("address_line1"),
-            facility_city=row.get("address_city"),
-            facility_state=row.get("address_state"),
+            facility_address=_get_str(row, "address_line1"),
+            facility_city=_get_str(row, "address_city"),
+            facility_state=_get_str(row, "address_state"),
             facility_zip=zip_code,
             latitude=lat,
             longitude=lon,
@@ -107,24 +168,24 @@ def normalize_hospital_affiliations(df: pd.DataFrame) -> list[PhysicianRecord]:
     """Normalize hospital affiliation data."""
     records = []
 
-    for idx, row in df.iterrows():
-        parsed = parse_name(row.get("physician_name", ""))
+    npis = _clean_npi_column(df)
+    source_ids = _generate_source_ids("hospital", df)
 
-        npi = row.get("npi")
-        if pd.isna(npi) or not npi:
-            npi = None
+    for row, npi, source_id in zip(df.itertuples(index=False), npis, source_ids):
+        name_raw = _get_str(row, "physician_name")
+        parsed = parse_name(name_raw or "")
 
         record = PhysicianRecord(
             source="hospital",
-            source_id=_generate_source_id("hospital", row, idx),
+            source_id=source_id,
             npi=npi,
-            name_raw=row.get("physician_name"),
+            name_raw=name_raw,
             name_first=parsed.first,
             name_last=parsed.last,
             name_middle=parsed.middle,
             name_suffix=parsed.suffix,
-            specialty=row.get("department"),
-            facility_name=row.get("hospital_name"),
+            specialty=_get_str(row, "department"),
+            facility_name=_get_str(row, "hospital_name"),
             latitude=None,
             longitude=None,
         )
@@ -138,13 +199,17 @@ def normalize_publications(df: pd.DataFrame) -> list[PhysicianRecord]:
     """Normalize publication data."""
     records = []
 
-    for idx, row in df.iterrows():
-        parsed = parse_name(row.get("author_name", ""))
+    source_ids = _generate_source_ids("publication", df)
+
+    for row, source_id in zip(df.itertuples(index=False), source_ids):
+        name_raw = _get_str(row, "author_name")
+        parsed = parse_name(name_raw or "")
 
         # Try to parse affiliation for location
-        affiliation = row.get("author_affiliation", "")
+        affiliation = _get(row, "author_affiliation", "")
+        parts: list[str] = []
         city, state = None, None
-        if affiliation and "," in affiliation:
+        if affiliation and pd.notna(affiliation) and "," in affiliation:
             parts = [p.strip() for p in affiliation.split(",")]
             if len(parts) >= 2:
                 # Last part might be state
@@ -154,15 +219,15 @@ def normalize_publications(df: pd.DataFrame) -> list[PhysicianRecord]:
 
         record = PhysicianRecord(
             source="publication",
-            source_id=_generate_source_id("publication", row, idx),
+            source_id=source_id,
             npi=None,  # Publications don't have NPI
-            name_raw=row.get("author_name"),
+            name_raw=name_raw,
             name_first=parsed.first,
             name_last=parsed.last,
             name_middle=parsed.middle,
             name_suffix=parsed.suffix,
             specialty=None,  # Can't determine from publication
-            facility_name=parts[0] if affiliation and parts else None,
+            facility_name=parts[0] if parts else None,
             facility_city=city,
             facility_state=state,
             latitude=None,
@@ -174,6 +239,36 @@ def normalize_publications(df: pd.DataFrame) -> list[PhysicianRecord]:
     return records
 
 
+_NORMALIZERS = {
+    "cms": normalize_cms_claims,
+    "license": normalize_state_licenses,
+    "hospital": normalize_hospital_affiliations,
+    "publication": normalize_publications,
+}
+
+
+def stream_normalized_records(
+    source: str,
+    filepath: Path,
+    chunk_size: int = 50_000,
+) -> Iterator[PhysicianRecord]:
+    """
+    Stream normalized records from a CSV in fixed-size chunks.
+
+    Peak memory stays at one chunk plus its records instead of the whole
+    frame coexisting with the full record list. Row indices continue across
+    chunks, so generated source IDs match the non-streaming path.
+    """
+    normalize = _NORMALIZERS.get(source)
+    if normalize is None:
+        raise ValueError(f"Unknown source: {source}")
+
+    from .loaders import SOURCE_COLUMNS, _read_csv
+
+    for chunk in _read_csv(filepath, usecols=SOURCE_COLUMNS.get(source), chunksize=chunk_size):
+        yield from normalize(chunk)
+
+
 def normalize_all(sources: dict[str, pd.DataFrame]) -> list[PhysicianRecord]:
     """Normalize all source data into PhysicianRecords."""
     all_records = []
@@ -1,12 +1,14 @@
 """Graph module for identity resolution."""
 
-from .builder import build_identity_graph, get_graph_stats
+from .builder import CountingGraph, build_identity_graph, get_graph_stats, match_type_name
 from .clustering import (
     assign_cluster_ids,
+    extract_cluster_attrs,
     find_clusters,
     get_cluster_for_node,
     get_cluster_sizes,
     get_cluster_subgraph,
+    split_cluster,
 )
 from .overmatching import (
     detect_overmatching,
@@ -23,21 +25,31 @@ from .pruning import (
     prune_weak_bridges,
 )
 from .quality import (
+    assess_all_clusters,
     assess_cluster_quality,
     get_quality_summary,
 )
+from .union_find import IncrementalClusters, clusters_from_matches
 
 __all__ = [
     # Builder
+    "CountingGraph",
     "build_identity_graph",
     "get_graph_stats",
+    "match_type_name",
     # Clustering
     "find_clusters",
     "get_cluster_subgraph",
     "get_cluster_for_node",
     "get_cluster_sizes",
     "assign_cluster_ids",
+    "extract_cluster_attrs",
+    "split_cluster",
+    # Union-find
+    "IncrementalClusters",
+    "clusters_from_matches",
     # Quality
+    "assess_all_clusters",
     "assess_cluster_quality",
     "get_quality_summary",
     # Overmatching
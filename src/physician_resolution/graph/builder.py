@@ -1,12 +1,102 @@
 """Build identity graph from match results."""
 
+import sys
+
 import networkx as nx
+import numpy as np
 
 from ..logging import get_logger
-from ..schemas.records import PhysicianRecord
+from ..schemas.records import (
+    SOURCE_RELIABILITY,
+    PhysicianRecord,
+    RecordColumns,
+)
 
 logger = get_logger("graph.builder")
 
+# Human-readable names for edge match types. Edges store the small integer
+# code (index into this tuple) rather than the string - one int instead of a
+# 50+ byte string per edge matters on graphs with millions of edges.
+MATCH_TYPES = ("unknown", "npi_exact", "name_strong", "name_moderate", "weak")
+
+
+def match_type_name(code: int) -> str:
+    """Render an edge's match_type_code for logs and exports."""
+    return MATCH_TYPES[code]
+
+
+class CountingGraph(nx.Graph):
+    """
+    Graph with an O(1) edge count maintained across mutations.
+
+    nx.Graph.number_of_edges() sums adjacency sizes on every call; the
+    pruning loops ask for the count constantly (and the component-label cache
+    stamps on it), so it is tracked incrementally instead.
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self._n_edges = 0
+        super().__init__(incoming_graph_data, **attr)
+
+    def number_of_edges(self, u=None, v=None) -> int:
+        if u is not None:
+            return super().number_of_edges(u, v)
+        return self.size()
+
+    def size(self, weight=None):
+        if weight is None and not nx.is_frozen(self):
+            return self._n_edges
+        # subgraph()/restricted_view() build a frozen G.__class__() and fill
+        # _adj directly, bypassing add_edge, so a view's counter is a stale 0.
+        # Views can't mutate, so the plain adjacency sum is correct (and cheap
+        # enough for their non-hot-path uses).
+        return super().size(weight)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        if not self.has_edge(u_of_edge, v_of_edge):
+            self._n_edges += 1
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        for edge in ebunch_to_add:
+            if len(edge) == 3:
+                u, v, data = edge
+                self.add_edge(u, v, **attr, **data)
+            else:
+                u, v = edge
+                self.add_edge(u, v, **attr)
+
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self._n_edges -= 1
+
+    def remove_edges_from(self, ebunch):
+        for edge in ebunch:
+            u, v = edge[:2]
+            if self.has_edge(u, v):
+                self.remove_edge(u, v)
+
+    def remove_node(self, n):
+        try:
+            # Self-loops appear once in the adjacency dict, so this is exact
+            self._n_edges -= len(self._adj[n])
+        except KeyError as err:
+            raise nx.NetworkXError(f"The node {n} is not in the graph.") from err
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        for n in nodes:
+            if n in self._adj:
+                self.remove_node(n)
+
+    def clear(self):
+        super().clear()
+        self._n_edges = 0
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._n_edges = 0
+
 
 def build_identity_graph(
     records: list[PhysicianRecord],
@@ -25,42 +115,72 @@ def build_identity_graph(
     Returns:
         NetworkX graph with nodes and weighted edges
     """
-    G = nx.Graph()
+    G = CountingGraph()
 
     # Create lookup for records
     record_lookup = {r.source_id: r for r in records}
 
-    # Add nodes with attributes
-    for record in records:
-        G.add_node(
+    # Add nodes with attributes in one bulk call - no per-node method
+    # dispatch or kwargs dict setup. Low-cardinality strings (source, state,
+    # npi) are interned so node-attr dicts share one object per distinct
+    # value and downstream == checks become pointer compares.
+    G.add_nodes_from(
+        (
             record.source_id,
-            source=record.source,
-            npi=record.npi,
-            name_raw=record.name_raw,
-            name_first=record.name_first,
-            name_last=record.name_last,
-            specialty=record.specialty,
-            facility_name=record.facility_name,
-            facility_state=record.facility_state,
+            {
+                "source": sys.intern(record.source),
+                "npi": sys.intern(record.npi) if record.npi else None,
+                "name_raw": record.name_raw,
+                "name_first": record.name_first,
+                "name_last": record.name_last,
+                "specialty": record.specialty,
+                "facility_name": record.facility_name,
+                "facility_state": sys.intern(record.facility_state)
+                if record.facility_state
+                else None,
+            },
         )
+        for record in records
+    )
 
     logger.info(f"Added {G.number_of_nodes()} nodes to graph")
 
-    # Add edges
-    for source_id_1, source_id_2, confidence in matches:
-        if source_id_1 in G and source_id_2 in G:
-            # Determine match type for edge attributes
-            rec1 = record_lookup.get(source_id_1)
-            rec2 = record_lookup.get(source_id_2)
-
-            match_type = _determine_edge_type(rec1, rec2, confidence)
-
+    # Add edges. Match types and source labels for all edges are computed in
+    # one vectorized pass over columnar record storage; the per-edge loop only
+    # does dict assignment.
+    valid = [m for m in matches if m[0] in G and m[1] in G]
+    if valid:
+        cols = RecordColumns.from_records(records)
+
+        u_idx = cols.positions(m[0] for m in valid)
+        v_idx = cols.positions(m[1] for m in valid)
+        confidence = np.fromiter((m[2] for m in valid), dtype=np.float64, count=len(valid))
+
+        npi = np.where(np.equal(cols.column("npi"), None), "", cols.column("npi")).astype(str)
+        npi_match = (npi[u_idx] == npi[v_idx]) & (npi[u_idx] != "")
+
+        match_type_codes = np.select(
+            [npi_match, confidence >= 0.85, confidence >= 0.6],
+            [
+                MATCH_TYPES.index("npi_exact"),
+                MATCH_TYPES.index("name_strong"),
+                MATCH_TYPES.index("name_moderate"),
+            ],
+            default=MATCH_TYPES.index("weak"),
+        ).astype(np.int8)
+
+        source = cols.column("source").astype(str)
+        edge_sources = np.char.add(np.char.add(source[u_idx], "|"), source[v_idx])
+
+        for (source_id_1, source_id_2, _), weight, code, sources in zip(
+            valid, confidence, match_type_codes, edge_sources
+        ):
             G.add_edge(
                 source_id_1,
                 source_id_2,
-                weight=confidence,
-                match_type=match_type,
-                sources=f"{rec1.source}|{rec2.source}" if rec1 and rec2 else "unknown",
+                weight=float(weight),
+                match_type_code=int(code),
+                sources=str(sources),
             )
 
     logger.info(f"Added {G.number_of_edges()} edges to graph")
@@ -68,30 +188,6 @@ def build_identity_graph(
     return G
 
 
-def _determine_edge_type(
-    rec1: PhysicianRecord | None,
-    rec2: PhysicianRecord | None,
-    confidence: float,
-) -> str:
-    """Determine the type of edge based on what matched."""
-    if not rec1 or not rec2:
-        return "unknown"
-
-    # NPI match
-    if rec1.npi and rec2.npi and rec1.npi == rec2.npi:
-        return "npi_exact"
-
-    # High confidence name match
-    if confidence >= 0.85:
-        return "name_strong"
-
-    # Medium confidence
-    if confidence >= 0.6:
-        return "name_moderate"
-
-    return "weak"
-
-
 def add_edge_weights(
     G: nx.Graph,
     record_lookup: dict[str, PhysicianRecord],
@@ -104,35 +200,31 @@ def add_edge_weights(
     - Source reliability
     - Cross-source bonus (matches across different sources are more valuable)
     """
-    source_reliability = {
-        "cms": 1.0,  # CMS has NPI, most reliable
-        "license": 0.9,  # State licenses are authoritative
-        "hospital": 0.8,  # Hospital directories vary in quality
-        "publication": 0.6,  # Publications have abbreviated names
-    }
-
-    for u, v, data in G.edges(data=True):
-        rec1 = record_lookup.get(u)
-        rec2 = record_lookup.get(v)
-
-        if not rec1 or not rec2:
-            continue
-
-        base_weight = data.get("weight", 0.5)
-
-        # Source reliability multiplier
-        rel1 = source_reliability.get(rec1.source, 0.5)
-        rel2 = source_reliability.get(rec2.source, 0.5)
-        source_mult = (rel1 + rel2) / 2
-
-        # Cross-source bonus
-        cross_source_mult = 1.1 if rec1.source != rec2.source else 1.0
-
-        # Calculate final weight
-        final_weight = base_weight * source_mult * cross_source_mult
-        final_weight = min(final_weight, 0.99)  # Cap at 0.99
-
-        G[u][v]["weight"] = final_weight
+    edges = list(G.edges(data=True))
+    if not edges:
+        return G
+
+    # Each endpoint's source code indexes the shared reliability table;
+    # -1 marks endpoints with no record, which keep their original weight
+    def code(source_id: str) -> int:
+        rec = record_lookup.get(source_id)
+        return rec.source_code if rec else -1
+
+    u_src = np.fromiter((code(u) for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    v_src = np.fromiter((code(v) for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    base = np.fromiter(
+        (data.get("weight", 0.5) for _, _, data in edges), dtype=np.float64, count=len(edges)
+    )
+
+    # All arithmetic happens on whole-edge arrays; the loop below only assigns
+    source_mult = (SOURCE_RELIABILITY[u_src] + SOURCE_RELIABILITY[v_src]) / 2
+    cross_source_mult = np.where(u_src != v_src, 1.1, 1.0)
+    final = np.minimum(base * source_mult * cross_source_mult, 0.99)  # Cap at 0.99
+
+    has_records = (u_src >= 0) & (v_src >= 0)
+    for (u, v, _), weight, ok in zip(edges, final, has_records):
+        if ok:
+            G[u][v]["weight"] = float(weight)
 
     return G
 
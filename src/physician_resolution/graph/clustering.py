@@ -1,12 +1,79 @@
 """Cluster detection using connected components."""
 
 import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from ..logging import get_logger
 
 logger = get_logger("graph.clustering")
 
 
+def _component_labels(G: nx.Graph) -> tuple[list[str], np.ndarray, dict[str, int]]:
+    """
+    Label connected components with scipy's C implementation.
+
+    Returns the node list, a parallel array of component labels, and a
+    node -> position index, avoiding nx.connected_components' pure-Python
+    adjacency walk. Results are cached on G.graph, stamped with the node and
+    edge counts so mutation (e.g. pruning) invalidates the cache for free.
+    """
+    stamp = (G.number_of_nodes(), G.number_of_edges())
+    cached = G.graph.get("_cc_cache")
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2], cached[3]
+
+    nodes = list(G)
+    if not nodes:
+        return nodes, np.empty(0, dtype=np.int64), {}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    num_edges = G.number_of_edges()
+    rows = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int64, count=num_edges)
+    cols = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int64, count=num_edges)
+    adjacency = coo_matrix(
+        (np.ones(num_edges, dtype=np.int8), (rows, cols)), shape=(len(nodes), len(nodes))
+    ).tocsr()
+
+    _, labels = connected_components(adjacency, directed=False)
+    G.graph["_cc_cache"] = (stamp, nodes, labels, index)
+    return nodes, labels, index
+
+
+def split_cluster(G: nx.Graph, cluster: set[str]) -> list[set[str]]:
+    """
+    Connected components of a cluster's induced subgraph, via scipy.
+
+    The pruning loops re-split one cluster after removing edges from it;
+    this builds a local CSR adjacency over just those nodes and labels
+    components in C, skipping nx.connected_components' Python BFS and the
+    whole-graph cache (which edge removal has just invalidated anyway).
+    """
+    nodes = list(cluster)
+    index = {node: i for i, node in enumerate(nodes)}
+
+    rows: list[int] = []
+    cols: list[int] = []
+    adj = G.adj
+    for u in nodes:
+        ui = index[u]
+        for v in adj[u]:
+            vi = index.get(v)
+            if vi is not None:
+                rows.append(ui)
+                cols.append(vi)
+
+    adjacency = coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(len(nodes), len(nodes))
+    ).tocsr()
+    _, labels = connected_components(adjacency, directed=False)
+
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    return [{nodes[i] for i in group} for group in np.split(order, boundaries)]
+
+
 def find_clusters(G: nx.Graph) -> list[set[str]]:
     """
     Find connected components in the graph.
@@ -16,7 +83,12 @@ def find_clusters(G: nx.Graph) -> list[set[str]]:
     Returns:
         List of sets, where each set contains source_ids belonging to one cluster
     """
-    clusters = list(nx.connected_components(G))
+    nodes, labels, _ = _component_labels(G)
+
+    # Group node positions by label: one argsort plus splits at label changes
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    clusters = [{nodes[i] for i in group} for group in np.split(order, boundaries)] if nodes else []
 
     # Sort by size (largest first) for consistent ordering
     clusters.sort(key=len, reverse=True)
@@ -44,11 +116,33 @@ def get_cluster_for_node(G: nx.Graph, node_id: str) -> set[str] | None:
     if node_id not in G:
         return None
 
-    for component in nx.connected_components(G):
-        if node_id in component:
-            return component
+    nodes, labels, index = _component_labels(G)
+    target = labels[index[node_id]]
+    return {nodes[i] for i in np.flatnonzero(labels == target)}
+
+
+def extract_cluster_attrs(
+    G: nx.Graph,
+    cluster: set[str],
+    attrs: tuple[str, ...] = ("npi", "specialty", "facility_state"),
+) -> dict[str, list]:
+    """
+    Extract node attributes for a cluster in one pass.
+
+    Returns {"nodes": [...]} plus one aligned value list per attribute.
+    Analyzers that inspect the same cluster (overmatching, quality, pruning)
+    can share this instead of each re-reading G.nodes per attribute.
+    """
+    nodes = list(cluster)
+    columns: dict[str, list] = {attr: [] for attr in attrs}
+
+    node_view = G.nodes
+    for node in nodes:
+        data = node_view[node]
+        for attr in attrs:
+            columns[attr].append(data.get(attr))
 
-    return None
+    return {"nodes": nodes, **columns}
 
 
 def get_cluster_sizes(clusters: list[set[str]]) -> dict[str, int]:
@@ -1,17 +1,42 @@
 """Overmatching detection for identifying incorrectly merged clusters."""
 
+import functools
+
 import networkx as nx
+import numpy as np
 
 from ..logging import get_logger
+from .clustering import extract_cluster_attrs
 
 logger = get_logger("graph.overmatching")
 
+# Specialties that are incompatible (different training paths)
+_INCOMPATIBLE_GROUPS = [
+    {"PEDIATRICS", "GERIATRICS"},
+    {"OBSTETRICS", "UROLOGY"},
+    {"DERMATOLOGY", "CARDIOLOGY"},
+    {"PSYCHIATRY", "ORTHOPEDIC SURGERY"},
+    {"OPHTHALMOLOGY", "GASTROENTEROLOGY"},
+]
+
+# Flattened token -> group index, so each specialty is scanned against the
+# token list once instead of once per specialty pair
+_TOKEN_TO_GROUP = {
+    token: group_idx for group_idx, group in enumerate(_INCOMPATIBLE_GROUPS) for token in group
+}
+
 
-def detect_overmatching(G: nx.Graph, cluster: set[str]) -> list[str]:
+def detect_overmatching(
+    G: nx.Graph,
+    cluster: set[str],
+    attrs: dict[str, list] | None = None,
+) -> list[str]:
     """
     Detect signs of overmatching in a cluster.
 
-    Returns list of warning messages for suspicious clusters.
+    Returns list of warning messages for suspicious clusters. Pass attrs
+    (from extract_cluster_attrs) to reuse node attributes already pulled for
+    this cluster.
 
     Checks:
     1. NPI conflict: Multiple distinct NPIs
@@ -22,12 +47,11 @@ def detect_overmatching(G: nx.Graph, cluster: set[str]) -> list[str]:
     """
     warnings = []
 
+    if attrs is None:
+        attrs = extract_cluster_attrs(G, cluster)
+
     # 1. NPI conflict check
-    npis = set()
-    for node in cluster:
-        npi = G.nodes[node].get("npi")
-        if npi:
-            npis.add(npi)
+    npis = {npi for npi in attrs["npi"] if npi}
 
     if len(npis) > 1:
         warnings.append(f"CRITICAL: NPI conflict - {len(npis)} different NPIs: {npis}")
@@ -38,24 +62,15 @@ def detect_overmatching(G: nx.Graph, cluster: set[str]) -> list[str]:
     elif len(cluster) > 20:
         warnings.append(f"NOTICE: Large cluster with {len(cluster)} records")
 
-    # 3. Specialty conflict
-    specialties = set()
-    for node in cluster:
-        spec = G.nodes[node].get("specialty")
-        if spec:
-            # Normalize specialty for comparison
-            specialties.add(spec.upper().strip())
+    # 3. Specialty conflict (normalized for comparison)
+    specialties = {spec.upper().strip() for spec in attrs["specialty"] if spec}
 
-    conflicting_pairs = _find_conflicting_specialties(specialties)
+    conflicting_pairs = _find_conflicting_specialties(frozenset(specialties))
     if conflicting_pairs:
         warnings.append(f"WARNING: Conflicting specialties found: {conflicting_pairs}")
 
     # 4. Geographic spread
-    states = set()
-    for node in cluster:
-        state = G.nodes[node].get("facility_state")
-        if state:
-            states.add(state.upper())
+    states = {state.upper() for state in attrs["facility_state"] if state}
 
     if len(states) > 3:
         warnings.append(f"WARNING: Records span {len(states)} states: {states}")
@@ -71,32 +86,58 @@ def detect_overmatching(G: nx.Graph, cluster: set[str]) -> list[str]:
     return warnings
 
 
-def _find_conflicting_specialties(specialties: set[str]) -> list[tuple[str, str]]:
-    """Find specialty pairs that are unlikely to belong to same physician."""
-    # Specialties that are incompatible (different training paths)
-    incompatible_groups = [
-        {"PEDIATRICS", "GERIATRICS"},
-        {"OBSTETRICS", "UROLOGY"},
-        {"DERMATOLOGY", "CARDIOLOGY"},
-        {"PSYCHIATRY", "ORTHOPEDIC SURGERY"},
-        {"OPHTHALMOLOGY", "GASTROENTEROLOGY"},
-    ]
+@functools.lru_cache(maxsize=4096)
+def _find_conflicting_specialties(specialties: frozenset[str]) -> list[tuple[str, str]]:
+    """
+    Find specialty pairs that are unlikely to belong to same physician.
+
+    Memoized on the specialty set - a handful of specialty combinations
+    dominate real clusters, so repeat clusters are dict hits.
+    """
+    # One substring scan per specialty builds group -> matched tokens; the
+    # pair loop then only touches specialties that matched some group, and
+    # compares token sets instead of re-scanning substrings per pair
+    matched: list[tuple[str, dict[int, frozenset[str]]]] = []
+    for spec in specialties:
+        groups: dict[int, set[str]] = {}
+        for token, group_idx in _TOKEN_TO_GROUP.items():
+            if token in spec:
+                groups.setdefault(group_idx, set()).add(token)
+        if groups:
+            matched.append((spec, {g: frozenset(tokens) for g, tokens in groups.items()}))
 
     conflicts = []
-    specialty_list = list(specialties)
-
-    for i, spec1 in enumerate(specialty_list):
-        for spec2 in specialty_list[i + 1 :]:
-            for group in incompatible_groups:
-                # Check if both specialties match different items in an incompatible group
-                matches1 = [g for g in group if g in spec1]
-                matches2 = [g for g in group if g in spec2]
-                if matches1 and matches2 and matches1 != matches2:
+    for i, (spec1, groups1) in enumerate(matched):
+        for spec2, groups2 in matched[i + 1 :]:
+            for group_idx in sorted(groups1.keys() & groups2.keys()):
+                # Conflict when both match the same group via different tokens
+                if groups1[group_idx] != groups2[group_idx]:
                     conflicts.append((spec1, spec2))
 
     return conflicts
 
 
+def _cluster_bridges(G: nx.Graph, cluster: set[str]) -> list[tuple[str, str]]:
+    """
+    Bridges of a cluster's induced subgraph, cached on the graph object.
+
+    Bridge-finding is a full DFS per call and the pipeline asks for the same
+    cluster's bridges from several analyzers; results are memoized on G.graph
+    stamped with the edge count so any mutation invalidates them. Operates on
+    a read-only subgraph view - no copy.
+    """
+    stamp = G.number_of_edges()
+    cached = G.graph.get("_bridge_cache")
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, {})
+        G.graph["_bridge_cache"] = cached
+
+    key = frozenset(cluster)
+    if key not in cached[1]:
+        cached[1][key] = list(nx.bridges(G.subgraph(cluster)))
+    return cached[1][key]
+
+
 def find_weak_bridges(
     G: nx.Graph,
     cluster: set[str],
@@ -109,14 +150,11 @@ def find_weak_bridges(
 
     Returns list of (node1, node2, weight) for weak bridges.
     """
-    subgraph = G.subgraph(cluster).copy()
     weak_bridges = []
 
-    # Find all bridges (edges whose removal disconnects the graph)
-    bridges = list(nx.bridges(subgraph))
-
-    for u, v in bridges:
-        weight = subgraph[u][v].get("weight", 0.5)
+    # Bridges (edges whose removal disconnects the cluster), cached per graph
+    for u, v in _cluster_bridges(G, cluster):
+        weight = G[u][v].get("weight", 0.5)
         if weight < threshold:
             weak_bridges.append((u, v, weight))
 
@@ -144,16 +182,14 @@ def suggest_cluster_splits(
 
     Removes weak bridges and returns resulting components.
     """
-    subgraph = G.subgraph(cluster).copy()
-
-    # Remove weak bridges
+    # Hide the weak bridges behind a restricted view instead of copying the
+    # subgraph and mutating it - no node/edge dict allocation at all
     weak_bridges = find_weak_bridges(G, cluster, threshold)
-    for u, v, _ in weak_bridges:
-        if subgraph.has_edge(u, v):
-            subgraph.remove_edge(u, v)
+    hidden = [(u, v) for u, v, _ in weak_bridges]
+    view = nx.restricted_view(G.subgraph(cluster), [], hidden)
 
     # Return new components
-    return [set(c) for c in nx.connected_components(subgraph)]
+    return [set(c) for c in nx.connected_components(view)]
 
 
 def get_cluster_cohesion(G: nx.Graph, cluster: set[str]) -> float:
@@ -167,16 +203,18 @@ def get_cluster_cohesion(G: nx.Graph, cluster: set[str]) -> float:
 
     subgraph = G.subgraph(cluster)
 
-    # Average edge weight
-    weights = [d["weight"] for _, _, d in subgraph.edges(data=True)]
-    if not weights:
+    # Average edge weight, reduced in NumPy without an intermediate list
+    weights = np.fromiter(
+        (d["weight"] for _, _, d in subgraph.edges(data=True)), dtype=np.float64
+    )
+    if weights.size == 0:
         return 0.0
 
-    avg_weight = sum(weights) / len(weights)
+    avg_weight = float(weights.mean())
 
     # Edge density
     max_edges = len(cluster) * (len(cluster) - 1) / 2
-    density = len(weights) / max_edges if max_edges > 0 else 0
+    density = weights.size / max_edges if max_edges > 0 else 0
 
     # Cohesion = weighted combination
     cohesion = (avg_weight * 0.6) + (density * 0.4)
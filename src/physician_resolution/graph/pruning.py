@@ -1,9 +1,12 @@
 """Graph pruning to remove weak edges and resolve conflicts."""
 
+import heapq
+
 import networkx as nx
+import numpy as np
 
 from ..logging import get_logger
-from .clustering import find_clusters
+from .clustering import extract_cluster_attrs, find_clusters, split_cluster
 
 logger = get_logger("graph.pruning")
 
@@ -14,7 +17,12 @@ def prune_low_confidence_edges(G: nx.Graph, threshold: float = 0.4) -> nx.Graph:
 
     This may split clusters (which is often correct).
     """
-    edges_to_remove = [(u, v) for u, v, d in G.edges(data=True) if d.get("weight", 0) < threshold]
+    # Weights go into one array so the threshold compare runs vectorized;
+    # removal stays a single batched call on the existing graph, which keeps
+    # node attributes and the G.graph caches intact (a rebuild would not)
+    edges = list(G.edges(data="weight", default=0))
+    weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    edges_to_remove = [edges[i][:2] for i in np.flatnonzero(weights < threshold)]
 
     G.remove_edges_from(edges_to_remove)
     logger.info(f"Removed {len(edges_to_remove)} low-confidence edges (threshold={threshold})")
@@ -30,33 +38,41 @@ def prune_npi_conflicts(G: nx.Graph) -> nx.Graph:
     """
     conflicts_resolved = 0
 
-    # Keep iterating until no conflicts remain
-    while True:
-        clusters = find_clusters(G)
-        conflict_found = False
-
-        for cluster in clusters:
-            npis = {}  # npi -> list of nodes
-            for node in cluster:
-                npi = G.nodes[node].get("npi")
-                if npi:
-                    if npi not in npis:
-                        npis[npi] = []
-                    npis[npi].append(node)
-
-            # Check for conflict
-            if len(npis) > 1:
-                conflict_found = True
-                # Find the weakest edge connecting nodes with different NPIs
-                weakest_edge = _find_weakest_cross_npi_edge(G, cluster, npis)
-                if weakest_edge:
-                    G.remove_edge(*weakest_edge)
-                    conflicts_resolved += 1
-                    logger.debug(f"Removed edge {weakest_edge} to resolve NPI conflict")
-                break  # Restart cluster detection
-
-        if not conflict_found:
-            break
+    # Removing an edge can only split the cluster it belongs to, so each
+    # conflicted cluster is resolved locally: after a removal, only that
+    # cluster's induced subgraph is re-split, never the whole graph
+    pending = find_clusters(G)
+
+    while pending:
+        cluster = pending.pop()
+
+        attrs = extract_cluster_attrs(G, cluster, attrs=("npi",))
+        npis = {}  # npi -> list of nodes
+        for node, npi in zip(attrs["nodes"], attrs["npi"]):
+            if npi:
+                if npi not in npis:
+                    npis[npi] = []
+                npis[npi].append(node)
+
+        # Check for conflict
+        if len(npis) > 1:
+            # A connected cluster stays conflicted until it splits (edge
+            # removal never changes its node set), so the candidate edges
+            # are heapified once and popped weakest-first instead of
+            # re-scanning every cluster edge per removal
+            heap = _cross_npi_edge_heap(G, cluster)
+            while heap:
+                _, u, v = heapq.heappop(heap)
+                G.remove_edge(u, v)
+                conflicts_resolved += 1
+                logger.debug("Removed edge %s to resolve NPI conflict", (u, v))
+
+                # Re-split just the affected cluster; once it fragments,
+                # recheck the pieces with their own candidate sets
+                fragments = split_cluster(G, cluster)
+                if len(fragments) > 1:
+                    pending.extend(fragments)
+                    break
 
     if conflicts_resolved > 0:
         logger.info(f"Resolved NPI conflicts by removing {conflicts_resolved} edges")
@@ -64,36 +80,55 @@ def prune_npi_conflicts(G: nx.Graph) -> nx.Graph:
     return G
 
 
-def _find_weakest_cross_npi_edge(
+def _cross_npi_edge_heap(
     G: nx.Graph,
     cluster: set[str],
-    npis: dict[str, list[str]],
-) -> tuple[str, str] | None:
-    """Find the weakest edge connecting nodes with different NPIs."""
-    subgraph = G.subgraph(cluster)
-    weakest_edge = None
-    weakest_weight = float("inf")
-
-    for u, v, data in subgraph.edges(data=True):
-        u_npi = G.nodes[u].get("npi")
-        v_npi = G.nodes[v].get("npi")
-
-        # Check if edge crosses NPI groups
-        if u_npi and v_npi and u_npi != v_npi:
-            weight = data.get("weight", 0.5)
-            if weight < weakest_weight:
-                weakest_weight = weight
-                weakest_edge = (u, v)
-
-        # Also check edges between NPI-having and non-NPI nodes that bridge groups
-        elif u_npi or v_npi:
-            # This edge might be bridging two NPI groups through a non-NPI node
-            weight = data.get("weight", 0.5)
-            if weight < weakest_weight:
-                weakest_weight = weight
-                weakest_edge = (u, v)
-
-    return weakest_edge
+) -> list[tuple[float, str, str]]:
+    """
+    Min-heap of (weight, u, v) over the cluster's cross-NPI edges.
+
+    Candidate edges either cross two distinct NPI groups directly, or touch
+    exactly one NPI-having node (possibly bridging groups through a non-NPI
+    node). Edges between two nodes carrying the *same* NPI are deliberately
+    never candidates - this is a behavior change from the original per-edge
+    scan, which would cut a same-NPI edge to resolve a conflict elsewhere in
+    the cluster. Cutting inside an NPI group is exactly the wrong split, and
+    every conflicted cluster still resolves without those edges: removing all
+    remaining candidates isolates each NPI group from the rest.
+
+    Each node's NPI is read once into an int-coded array and the candidate
+    mask runs vectorized, instead of two attribute-dict reads per edge.
+    """
+    edges = list(G.subgraph(cluster).edges(data="weight", default=0.5))
+    if not edges:
+        return []
+
+    nodes = list(cluster)
+    node_idx = {node: i for i, node in enumerate(nodes)}
+
+    npi_codes: dict[str, int] = {}
+
+    def npi_code(node: str) -> int:
+        npi = G.nodes[node].get("npi")
+        if not npi:
+            return -1
+        return npi_codes.setdefault(npi, len(npi_codes))
+
+    npi_arr = np.fromiter((npi_code(n) for n in nodes), dtype=np.int64, count=len(nodes))
+
+    u_arr = np.fromiter((node_idx[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    v_arr = np.fromiter((node_idx[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    w_arr = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+
+    a, b = npi_arr[u_arr], npi_arr[v_arr]
+    has_a, has_b = a >= 0, b >= 0
+    candidate = (has_a | has_b) & ~(has_a & has_b & (a == b))
+
+    heap = [
+        (float(w_arr[i]), edges[i][0], edges[i][1]) for i in np.flatnonzero(candidate)
+    ]
+    heapq.heapify(heap)
+    return heap
 
 
 def prune_oversized_clusters(G: nx.Graph, max_size: int = 100) -> nx.Graph:
@@ -102,36 +137,33 @@ def prune_oversized_clusters(G: nx.Graph, max_size: int = 100) -> nx.Graph:
 
     Very large clusters are usually overmatched.
     """
-    iterations = 0
-    max_iterations = 1000  # Safety limit
-
-    while iterations < max_iterations:
-        clusters = find_clusters(G)
-        oversized = [c for c in clusters if len(c) > max_size]
+    edges_removed = 0
+    pending = [c for c in find_clusters(G) if len(c) > max_size]
 
-        if not oversized:
-            break
+    while pending:
+        cluster = pending.pop()
 
-        for cluster in oversized:
-            # Find and remove weakest edge
-            subgraph = G.subgraph(cluster)
-            weakest_edge = None
-            weakest_weight = float("inf")
+        # Remove the k lowest-weight edges in one batch, with k sized to the
+        # excess, then re-split only this cluster - far fewer rounds than
+        # removing one edge and re-clustering the whole graph each time
+        edges = sorted(
+            G.subgraph(cluster).edges(data="weight", default=0.5), key=lambda e: e[2]
+        )
+        batch = [(u, v) for u, v, _ in edges[: max(1, len(cluster) - max_size)]]
 
-            for u, v, data in subgraph.edges(data=True):
-                weight = data.get("weight", 0.5)
-                if weight < weakest_weight:
-                    weakest_weight = weight
-                    weakest_edge = (u, v)
+        if not batch:
+            continue
 
-            if weakest_edge:
-                G.remove_edge(*weakest_edge)
-                logger.debug(f"Removed edge {weakest_edge} from oversized cluster")
+        G.remove_edges_from(batch)
+        edges_removed += len(batch)
+        logger.debug("Removed %d edges from oversized cluster of %d", len(batch), len(cluster))
 
-        iterations += 1
+        pending.extend(
+            fragment for fragment in split_cluster(G, cluster) if len(fragment) > max_size
+        )
 
-    if iterations > 0:
-        logger.info(f"Pruned oversized clusters in {iterations} iterations")
+    if edges_removed > 0:
+        logger.info(f"Pruned oversized clusters by removing {edges_removed} edges")
 
     return G
 
@@ -142,29 +174,27 @@ def prune_weak_bridges(G: nx.Graph, threshold: float = 0.5) -> nx.Graph:
 
     These are often false positive matches.
     """
-    edges_removed = 0
-
+    # One DFS finds the bridges of every component at once; clusters of two
+    # records keep their single edge, as before
+    eligible: set[str] = set()
     for cluster in find_clusters(G):
-        if len(cluster) <= 2:
-            continue
-
-        subgraph = G.subgraph(cluster).copy()
+        if len(cluster) > 2:
+            eligible.update(cluster)
 
-        # Find bridges
-        try:
-            bridges = list(nx.bridges(subgraph))
-        except nx.NetworkXError:
+    to_remove = []
+    for u, v in nx.bridges(G):
+        if u not in eligible:
             continue
+        weight = G[u][v].get("weight", 0.5)
+        if weight < threshold:
+            to_remove.append((u, v))
+            logger.debug("Removed weak bridge (%s, %s) with weight %s", u, v, weight)
 
-        for u, v in bridges:
-            weight = G[u][v].get("weight", 0.5)
-            if weight < threshold:
-                G.remove_edge(u, v)
-                edges_removed += 1
-                logger.debug(f"Removed weak bridge ({u}, {v}) with weight {weight}")
+    # Batched so removals don't invalidate the bridge iterator
+    G.remove_edges_from(to_remove)
 
-    if edges_removed > 0:
-        logger.info(f"Removed {edges_removed} weak bridge edges")
+    if to_remove:
+        logger.info(f"Removed {len(to_remove)} weak bridge edges")
 
     return G
 
@@ -1,9 +1,11 @@
 """Cluster quality assessment."""
 
 import networkx as nx
+import numpy as np
 
 from ..logging import get_logger
 from ..schemas.clusters import ClusterQuality
+from .clustering import extract_cluster_attrs
 
 logger = get_logger("graph.quality")
 
@@ -12,6 +14,8 @@ def assess_cluster_quality(
     G: nx.Graph,
     cluster: set[str],
     cluster_id: str = "",
+    attrs: dict[str, list] | None = None,
+    edge_weights: np.ndarray | None = None,
 ) -> ClusterQuality:
     """
     Evaluate whether a cluster looks like one real physician.
@@ -28,23 +32,32 @@ def assess_cluster_quality(
     - Multiple specialties
     - Locations in different states
     """
-    subgraph = G.subgraph(cluster)
     warnings = []
 
+    if attrs is None:
+        attrs = extract_cluster_attrs(G, cluster)
+
     # Size
     size = len(cluster)
 
-    # Edge weight statistics
-    edge_weights = [d["weight"] for _, _, d in subgraph.edges(data=True)]
-    avg_edge_weight = sum(edge_weights) / len(edge_weights) if edge_weights else 0.0
-    min_edge_weight = min(edge_weights) if edge_weights else 0.0
+    # Edge weight statistics, reduced in NumPy without an intermediate list.
+    # Bulk callers (assess_all_clusters) pass the weights in, sliced from one
+    # whole-graph edge pass, and skip the subgraph walk entirely
+    if edge_weights is None:
+        edge_weights = np.fromiter(
+            (d["weight"] for _, _, d in G.subgraph(cluster).edges(data=True)),
+            dtype=np.float64,
+        )
+    num_edges = edge_weights.size
+    avg_edge_weight = float(edge_weights.mean()) if num_edges else 0.0
+    min_edge_weight = float(edge_weights.min()) if num_edges else 0.0
 
     # Density
     max_edges = size * (size - 1) / 2
-    density = len(edge_weights) / max_edges if max_edges > 0 else 1.0
+    density = num_edges / max_edges if max_edges > 0 else 1.0
 
     # NPI analysis
-    npis = [G.nodes[n].get("npi") for n in cluster if G.nodes[n].get("npi")]
+    npis = [npi for npi in attrs["npi"] if npi]
     unique_npis = set(npis)
     npi_count = len(unique_npis)
     npi_conflict = npi_count > 1
@@ -53,7 +66,7 @@ def assess_cluster_quality(
         warnings.append(f"NPI conflict: {npi_count} different NPIs found: {unique_npis}")
 
     # State analysis
-    states = [G.nodes[n].get("facility_state") for n in cluster if G.nodes[n].get("facility_state")]
+    states = [state for state in attrs["facility_state"] if state]
     unique_states = set(states)
     state_count = len(unique_states)
 
@@ -61,7 +74,7 @@ def assess_cluster_quality(
         warnings.append(f"Geographic spread: records in {state_count} states: {unique_states}")
 
     # Specialty analysis
-    specialties = [G.nodes[n].get("specialty") for n in cluster if G.nodes[n].get("specialty")]
+    specialties = [spec for spec in attrs["specialty"] if spec]
     unique_specialties = set(specialties)
     specialty_count = len(unique_specialties)
 
@@ -99,6 +112,59 @@ def assess_cluster_quality(
     )
 
 
+def assess_all_clusters(
+    G: nx.Graph,
+    clusters: list[set[str]],
+    id_format: str = "CLUSTER_{:05d}",
+) -> list[ClusterQuality]:
+    """
+    Assess every cluster with one pass over the graph's nodes and edges.
+
+    Per-cluster assessment walks an induced subgraph per call; over 100k+
+    clusters that re-touches every edge dict through NetworkX views. Here
+    node attributes and edge weights are pulled once for the whole graph,
+    grouped by cluster, and handed to assess_cluster_quality precomputed.
+    """
+    cluster_of: dict[str, int] = {}
+    for idx, cluster in enumerate(clusters):
+        for node in cluster:
+            cluster_of[node] = idx
+
+    # One node pass builds every cluster's attribute columns
+    all_attrs: list[dict[str, list]] = [
+        {"nodes": [], "npi": [], "specialty": [], "facility_state": []} for _ in clusters
+    ]
+    for node, data in G.nodes(data=True):
+        idx = cluster_of.get(node)
+        if idx is None:
+            continue
+        attrs = all_attrs[idx]
+        attrs["nodes"].append(node)
+        attrs["npi"].append(data.get("npi"))
+        attrs["specialty"].append(data.get("specialty"))
+        attrs["facility_state"].append(data.get("facility_state"))
+
+    # One edge pass groups intra-cluster weights; edges leaving a cluster
+    # (possible when clusters are not full components) are skipped, matching
+    # the induced-subgraph semantics of the per-cluster path
+    weight_lists: list[list[float]] = [[] for _ in clusters]
+    for u, v, weight in G.edges(data="weight", default=0.0):
+        idx = cluster_of.get(u)
+        if idx is not None and cluster_of.get(v) == idx:
+            weight_lists[idx].append(weight)
+
+    return [
+        assess_cluster_quality(
+            G,
+            cluster,
+            id_format.format(idx),
+            attrs=all_attrs[idx],
+            edge_weights=np.asarray(weight_lists[idx], dtype=np.float64),
+        )
+        for idx, cluster in enumerate(clusters)
+    ]
+
+
 def _calculate_quality_score(
     size: int,
     avg_edge_weight: float,
@@ -6,13 +6,14 @@ import sys
 def setup_logging(level: str | None = None) -> logging.Logger:
     """Configure and return the root logger for the pipeline."""
     level = level or os.getenv("LOG_LEVEL", "INFO")
+    log_level = getattr(logging, level.upper())
 
     logger = logging.getLogger("physician_resolution")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(getattr(logging, level.upper()))
+        handler.setLevel(log_level)
 
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
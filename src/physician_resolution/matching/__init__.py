@@ -5,6 +5,7 @@ from .blocking import (
     block_by_last_name_state,
     block_by_npi,
     block_by_soundex_state,
+    get_candidate_pair_indices,
     get_candidate_pairs,
 )
 from .classifier import (
@@ -13,7 +14,11 @@ from .classifier import (
     get_confirmed_matches,
 )
 from .similarity import (
+    calculate_location_scores_batch,
     calculate_name_similarity,
+    calculate_name_similarity_matrix,
+    calculate_similarity_at,
+    overall_scores_batch,
     calculate_similarity,
 )
 
@@ -24,9 +29,14 @@ __all__ = [
     "block_by_soundex_state",
     "block_by_last_name_first_initial",
     "get_candidate_pairs",
+    "get_candidate_pair_indices",
     # Similarity
     "calculate_similarity",
+    "calculate_location_scores_batch",
     "calculate_name_similarity",
+    "calculate_name_similarity_matrix",
+    "calculate_similarity_at",
+    "overall_scores_batch",
     # Classification
     "classify_match",
     "find_matches",
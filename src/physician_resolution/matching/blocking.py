@@ -1,77 +1,132 @@
 """Blocking strategies to reduce pairwise comparison space."""
 
-from collections import defaultdict
-
 import jellyfish
+import numpy as np
+import pandas as pd
 
 from ..logging import get_logger
 from ..schemas.records import PhysicianRecord
+from .lsh import lsh_candidate_positions
 
 logger = get_logger("matching.blocking")
 
+# Soundex per distinct last name, cached for the life of the process - name
+# vocabularies repeat heavily across blocking calls and pipeline runs
+_soundex_cache: dict[str, str] = {}
+_soundex_failed: set[str] = set()
+
+
+def _soundex_codes(names: pd.Series) -> pd.Series:
+    """Map a last-name column to Soundex codes, computing new names only."""
+    for name in names.dropna().unique():
+        if not name or name in _soundex_cache or name in _soundex_failed:
+            continue
+        try:
+            _soundex_cache[name] = jellyfish.soundex(name)
+        except Exception:
+            # Skip records where soundex fails
+            _soundex_failed.add(name)
+    return names.map(_soundex_cache)
+
 
-def block_by_npi(records: list[PhysicianRecord]) -> dict[str, list[PhysicianRecord]]:
+def build_blocking_frame(records: list[PhysicianRecord]) -> pd.DataFrame:
+    """
+    Normalized blocking-key columns for a record list, computed once.
+
+    Pass this to the block_by_* functions to share one normalization pass
+    (upper/strip/soundex) across strategies instead of redoing it per call.
+    """
+    df = pd.DataFrame(
+        {
+            "npi": [r.npi for r in records],
+            "name_last": [r.name_last for r in records],
+            "name_first": [r.name_first for r in records],
+            "state": [r.facility_state for r in records],
+        }
+    )
+
+    last = df["name_last"].str.upper().str.strip()
+    df["last_norm"] = last.where(last.notna() & (last != ""))
+    df["state_norm"] = df["state"].where(df["state"].notna() & (df["state"] != ""), "XX").str.upper()
+    first_initial = df["name_first"].str[:1].str.upper()
+    df["first_initial"] = first_initial.where(first_initial.notna() & (first_initial != ""))
+
+    # Soundex is computed once per distinct last name, cached across calls
+    df["soundex_last"] = _soundex_codes(df["name_last"])
+
+    # NPI parsed to int64 at record construction; 0 marks missing/malformed
+    df["npi_int"] = np.fromiter((r.npi_int for r in records), dtype=np.int64, count=len(records))
+
+    return df
+
+
+def _blocks_from_keys(
+    records: list[PhysicianRecord],
+    keys: pd.Series,
+) -> dict[str, list[PhysicianRecord]]:
+    """
+    Group record positions by key and keep blocks with 2+ records.
+
+    Grouping runs in pandas' C groupby; rows with a null key are dropped.
+    """
+    blocks = {}
+    for key, positions in keys.dropna().groupby(keys, sort=False).groups.items():
+        if len(positions) >= 2:
+            blocks[key] = [records[i] for i in positions]
+    return blocks
+
+
+def block_by_npi(
+    records: list[PhysicianRecord],
+    df: pd.DataFrame | None = None,
+) -> dict[str, list[PhysicianRecord]]:
     """
     Group records that share an NPI.
 
     This is the strongest blocking key - NPI is unique per physician.
     """
-    blocks: dict[str, list[PhysicianRecord]] = defaultdict(list)
-
-    for record in records:
-        if record.npi:
-            blocks[record.npi].append(record)
+    if df is None:
+        df = build_blocking_frame(records)
 
-    # Filter to blocks with 2+ records
-    blocks = {k: v for k, v in blocks.items() if len(v) >= 2}
+    keys = df["npi"].where(df["npi"].notna() & (df["npi"] != ""))
+    blocks = _blocks_from_keys(records, keys)
 
     logger.info(f"NPI blocking: {len(blocks)} blocks from {len(records)} records")
     return blocks
 
 
-def block_by_last_name_state(records: list[PhysicianRecord]) -> dict[str, list[PhysicianRecord]]:
+def block_by_last_name_state(
+    records: list[PhysicianRecord],
+    df: pd.DataFrame | None = None,
+) -> dict[str, list[PhysicianRecord]]:
     """
     Group by (last_name, state).
 
     For records without NPI, this is a reasonable blocking key.
     """
-    blocks: dict[str, list[PhysicianRecord]] = defaultdict(list)
-
-    for record in records:
-        if record.name_last:
-            last = record.name_last.upper().strip()
-            state = (record.facility_state or "XX").upper()
-            key = f"{last}|{state}"
-            blocks[key].append(record)
+    if df is None:
+        df = build_blocking_frame(records)
 
-    # Filter to blocks with 2+ records
-    blocks = {k: v for k, v in blocks.items() if len(v) >= 2}
+    keys = df["last_norm"] + "|" + df["state_norm"]
+    blocks = _blocks_from_keys(records, keys)
 
     logger.info(f"Last name + state blocking: {len(blocks)} blocks")
     return blocks
 
 
-def block_by_soundex_state(records: list[PhysicianRecord]) -> dict[str, list[PhysicianRecord]]:
+def block_by_soundex_state(
+    records: list[PhysicianRecord],
+    df: pd.DataFrame | None = None,
+) -> dict[str, list[PhysicianRecord]]:
     """
     Phonetic blocking using Soundex.
 
     Groups records where last names sound similar (SMITH and SMYTH).
     """
-    blocks: dict[str, list[PhysicianRecord]] = defaultdict(list)
+    if df is None:
+        df = build_blocking_frame(records)
 
-    for record in records:
-        if record.name_last:
-            try:
-                soundex = jellyfish.soundex(record.name_last)
-                state = (record.facility_state or "XX").upper()
-                key = f"{soundex}|{state}"
-                blocks[key].append(record)
-            except Exception:
-                # Skip records where soundex fails
-                pass
-
-    # Filter to blocks with 2+ records
-    blocks = {k: v for k, v in blocks.items() if len(v) >= 2}
+    blocks = _blocks_from_keys(records, df["soundex_last"] + "|" + df["state_norm"])
 
     logger.info(f"Soundex + state blocking: {len(blocks)} blocks")
     return blocks
@@ -79,72 +134,118 @@ def block_by_soundex_state(records: list[PhysicianRecord]) -> dict[str, list[Phy
 
 def block_by_last_name_first_initial(
     records: list[PhysicianRecord],
+    df: pd.DataFrame | None = None,
 ) -> dict[str, list[PhysicianRecord]]:
     """
     Group by (last_name, first_initial).
 
     More restrictive than just last name, reduces false positives.
     """
-    blocks: dict[str, list[PhysicianRecord]] = defaultdict(list)
-
-    for record in records:
-        if record.name_last and record.name_first:
-            last = record.name_last.upper().strip()
-            first_initial = record.name_first[0].upper()
-            key = f"{last}|{first_initial}"
-            blocks[key].append(record)
+    if df is None:
+        df = build_blocking_frame(records)
 
-    blocks = {k: v for k, v in blocks.items() if len(v) >= 2}
+    keys = df["last_norm"] + "|" + df["first_initial"]
+    blocks = _blocks_from_keys(records, keys)
 
     logger.info(f"Last name + first initial blocking: {len(blocks)} blocks")
     return blocks
 
 
-def get_candidate_pairs(
+def get_candidate_pair_indices(
     records: list[PhysicianRecord],
     use_soundex: bool = True,
-) -> list[tuple[PhysicianRecord, PhysicianRecord]]:
+    lsh_block_threshold: int | None = None,
+) -> np.ndarray:
     """
-    Get all candidate pairs for comparison using multiple blocking strategies.
+    Deduplicated candidate pairs as packed uint64 record-position keys.
 
-    Returns deduplicated pairs (A,B) where A.source_id < B.source_id.
-    """
-    seen_pairs: set[tuple[str, str]] = set()
-    pairs: list[tuple[PhysicianRecord, PhysicianRecord]] = []
+    Each element packs two int32 positions into ``(min << 32) | max``; unpack
+    with ``>> 32`` and ``& 0xFFFFFFFF``. Downstream scorers that work on
+    column arrays can consume these directly without ever materializing
+    record-object pairs.
 
-    def add_pairs_from_block(block: list[PhysicianRecord]) -> None:
-        for i, rec1 in enumerate(block):
-            for rec2 in block[i + 1 :]:
-                # Skip same-source comparisons (optional, depends on use case)
-                # if rec1.source == rec2.source:
-                #     continue
-
-                # Canonical ordering
-                if rec1.source_id < rec2.source_id:
-                    pair_key = (rec1.source_id, rec2.source_id)
-                else:
-                    pair_key = (rec2.source_id, rec1.source_id)
-                    rec1, rec2 = rec2, rec1
-
-                if pair_key not in seen_pairs:
-                    seen_pairs.add(pair_key)
-                    pairs.append((rec1, rec2))
-
-    # Apply blocking strategies
+    With lsh_block_threshold set, blocks at or above that size are not
+    enumerated quadratically; a MinHash/LSH prefilter over name shingles
+    keeps only likely near-duplicate pairs, so one very common surname
+    can't blow up the pair count.
+    """
+    # Pairs are deduplicated as packed uint64 keys (two int32 record
+    # positions), which hash and store an order of magnitude cheaper than
+    # a set of source_id string tuples. Positions come straight out of each
+    # groupby - no per-block record lists are materialized at all
+    packed_blocks: list[np.ndarray] = []
+    name_keys: list[str] | None = None
+
+    def pack(a: np.ndarray, b: np.ndarray) -> None:
+        packed_blocks.append(
+            (np.minimum(a, b).astype(np.uint64) << np.uint64(32))
+            | np.maximum(a, b).astype(np.uint64)
+        )
+
+    def add_pairs_from_keys(keys: pd.Series) -> None:
+        for positions in keys.dropna().groupby(keys, sort=False).groups.values():
+            if len(positions) < 2:
+                continue
+            pos = positions.to_numpy(dtype=np.int64)
+            if lsh_block_threshold is not None and len(pos) >= lsh_block_threshold:
+                candidates = lsh_candidate_positions([name_keys[p] for p in pos])
+                if not candidates:
+                    continue
+                i, j = np.array(candidates, dtype=np.int64).T
+            else:
+                i, j = np.triu_indices(len(pos), k=1)
+            pack(pos[i], pos[j])
+
+    # Apply blocking strategies, sharing one normalization pass
     logger.info("Applying blocking strategies...")
-
-    # NPI blocking (highest confidence)
-    for block in block_by_npi(records).values():
-        add_pairs_from_block(block)
+    df = build_blocking_frame(records)
+
+    if lsh_block_threshold is not None:
+        # Shingle key per record for the oversized-block prefilter
+        name_keys = [
+            (record.name_last_norm or "") + (record.name_first or "")[:1].upper()
+            for record in records
+        ]
+
+    # NPI blocking (highest confidence). Valid NPIs group on the int64 key
+    # parsed once at ingestion - int hashing beats string hashing and the
+    # column is 8 bytes per row; the rare present-but-malformed NPI falls
+    # back to its string key so no pair is lost
+    add_pairs_from_keys(df["npi_int"].where(df["npi_int"] != 0))
+    add_pairs_from_keys(
+        df["npi"].where(df["npi"].notna() & (df["npi"] != "") & (df["npi_int"] == 0))
+    )
 
     # Last name + state blocking
-    for block in block_by_last_name_state(records).values():
-        add_pairs_from_block(block)
+    add_pairs_from_keys(df["last_norm"] + "|" + df["state_norm"])
 
     # Soundex blocking (catches typos)
     if use_soundex:
-        for block in block_by_soundex_state(records).values():
-            add_pairs_from_block(block)
+        add_pairs_from_keys(df["soundex_last"] + "|" + df["state_norm"])
+
+    if not packed_blocks:
+        return np.empty(0, dtype=np.uint64)
+    return np.unique(np.concatenate(packed_blocks))
+
+
+def get_candidate_pairs(
+    records: list[PhysicianRecord],
+    use_soundex: bool = True,
+    lsh_block_threshold: int | None = None,
+) -> list[tuple[PhysicianRecord, PhysicianRecord]]:
+    """
+    Get all candidate pairs for comparison using multiple blocking strategies.
+
+    Returns deduplicated pairs (A,B) where A.source_id < B.source_id. See
+    get_candidate_pair_indices for the packed positional form this wraps.
+    """
+    pairs: list[tuple[PhysicianRecord, PhysicianRecord]] = []
+    for packed in get_candidate_pair_indices(records, use_soundex, lsh_block_threshold):
+        rec1 = records[int(packed >> np.uint64(32))]
+        rec2 = records[int(packed & np.uint64(0xFFFFFFFF))]
+        if rec2.source_id < rec1.source_id:
+            rec1, rec2 = rec2, rec1
+        pairs.append((rec1, rec2))
 
     logger.info(f"Generated {len(pairs)} candidate pairs")
     return pairs
@@ -1,14 +1,29 @@
 """Match classification from similarity scores."""
 
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 from ..config import PipelineConfig
 from ..logging import get_logger
-from ..schemas.matches import MatchDecision, MatchResult, SimilarityScores
+from ..schemas.matches import (
+    DECISION_CODES,
+    MatchDecision,
+    MatchResult,
+    MatchResultBatch,
+    SimilarityScores,
+)
 from ..schemas.records import PhysicianRecord
 from .blocking import get_candidate_pairs
-from .similarity import calculate_similarity
+from .similarity import calculate_similarity, overall_scores_batch
 
 logger = get_logger("matching.classifier")
 
+# Pair scoring fans out across processes only past this size; below it the
+# pool spin-up and pickling overhead outweighs the win
+_PARALLEL_THRESHOLD = 20_000
+_SCORE_CHUNK_SIZE = 10_000
+
 
 def classify_match(
     scores: SimilarityScores,
@@ -53,6 +68,76 @@ def classify_match(
     return MatchDecision.UNCERTAIN, confidence
 
 
+def _score_chunk(
+    pairs: list[tuple[PhysicianRecord, PhysicianRecord]],
+) -> list[SimilarityScores]:
+    """Score one chunk of candidate pairs (runs in a worker process)."""
+    return [calculate_similarity(record1, record2) for record1, record2 in pairs]
+
+
+def _score_pairs(
+    pairs: list[tuple[PhysicianRecord, PhysicianRecord]],
+    n_workers: int | None = None,
+) -> list[SimilarityScores]:
+    """
+    Score candidate pairs, fanning out across cores for large batches.
+
+    Each pair is scored independently, so chunks go to a process pool and
+    come back in order; small batches stay on one core.
+    """
+    if len(pairs) < _PARALLEL_THRESHOLD:
+        return _score_chunk(pairs)
+
+    chunks = [pairs[i : i + _SCORE_CHUNK_SIZE] for i in range(0, len(pairs), _SCORE_CHUNK_SIZE)]
+    logger.info(f"Scoring {len(pairs)} pairs across {len(chunks)} parallel chunks")
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return [scores for chunk in executor.map(_score_chunk, chunks) for scores in chunk]
+
+
+def classify_matches_batch(
+    scores_list: list[SimilarityScores],
+    config: PipelineConfig | None = None,
+) -> tuple[list[MatchDecision], np.ndarray]:
+    """
+    Classify a batch of score sets at once.
+
+    Same decision rules as classify_match, but the thresholding and
+    confidence arithmetic run over whole NumPy arrays instead of per-pair
+    Python branches. Returns (decisions, confidences) aligned to the input.
+    """
+    config = config or PipelineConfig()
+    n = len(scores_list)
+
+    overall = np.fromiter((s.overall_score for s in scores_list), dtype=np.float64, count=n)
+    npi = np.fromiter(
+        (np.nan if s.npi_match is None else s.npi_match for s in scores_list),
+        dtype=np.float64,
+        count=n,
+    )
+
+    match_conf = np.minimum(
+        (overall - config.match_threshold) / (1.0 - config.match_threshold) + 0.7, 0.95
+    )
+    non_match_conf = np.minimum(
+        (config.non_match_threshold - overall) / config.non_match_threshold + 0.7, 0.95
+    )
+    mid = (config.match_threshold + config.non_match_threshold) / 2
+    uncertain_conf = 0.3 + np.abs(overall - mid) * 0.4
+
+    conditions = [
+        npi == 0.0,  # NPI conflict is always a non-match
+        npi == 1.0,  # NPI match is always a match
+        overall >= config.match_threshold,
+        overall <= config.non_match_threshold,
+    ]
+
+    decision_codes = np.select(conditions, [0, 1, 1, 0], default=2)
+    confidences = np.select(conditions, [1.0, 0.95, match_conf, non_match_conf], uncertain_conf)
+
+    return [DECISION_CODES[c] for c in decision_codes], confidences
+
+
 def determine_match_type(
     record1: PhysicianRecord,
     record2: PhysicianRecord,
@@ -79,6 +164,38 @@ def determine_match_type(
     return "weak"
 
 
+def determine_match_types_batch(
+    npi_match: np.ndarray,
+    name_similarity: np.ndarray,
+    specialty_match: np.ndarray,
+    location_score: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized determine_match_type over score arrays.
+
+    Same branch ladder as the scalar version, expressed as one np.select
+    so labeling millions of pairs costs a few array ops instead of a Python
+    call per pair. NaN specialty/NPI scores fall through like None does.
+    """
+    conditions = [
+        npi_match == 1.0,
+        (name_similarity >= 0.9) & (location_score >= 0.7),
+        (name_similarity >= 0.9) & (specialty_match >= 0.9),
+        name_similarity >= 0.9,
+        (name_similarity >= 0.7) & (location_score >= 0.7),
+        name_similarity >= 0.7,
+    ]
+    choices = [
+        "npi_exact",
+        "name_location_strong",
+        "name_specialty",
+        "name_strong",
+        "name_location",
+        "name_moderate",
+    ]
+    return np.select(conditions, choices, default="weak")
+
+
 def find_matches(
     records: list[PhysicianRecord],
     config: PipelineConfig | None = None,
@@ -93,18 +210,18 @@ def find_matches(
     # Get candidate pairs via blocking
     pairs = get_candidate_pairs(records, use_soundex=config.use_soundex_blocking)
 
+    # Score pairs, then classify the whole batch in one vectorized pass
+    scores_list = _score_pairs(pairs, n_workers=config.n_workers)
+    decisions, confidences = classify_matches_batch(scores_list, config)
+
     results: list[MatchResult] = []
     match_count = 0
     non_match_count = 0
     uncertain_count = 0
 
-    for record1, record2 in pairs:
-        # Calculate similarity
-        scores = calculate_similarity(record1, record2)
-
-        # Classify
-        decision, confidence = classify_match(scores, config)
-
+    for (record1, record2), scores, decision, confidence in zip(
+        pairs, scores_list, decisions, confidences
+    ):
         # Determine match type
         match_type = determine_match_type(record1, record2, scores)
 
@@ -113,7 +230,7 @@ def find_matches(
             source_id_2=record2.source_id,
             scores=scores,
             decision=decision,
-            confidence=confidence,
+            confidence=float(confidence),
             match_type=match_type,
         )
         results.append(result)
@@ -133,6 +250,74 @@ def find_matches(
     return results
 
 
+def find_matches_batch(
+    records: list[PhysicianRecord],
+    config: PipelineConfig | None = None,
+) -> MatchResultBatch:
+    """
+    Find all matches among a list of records, returning columnar results.
+
+    Same scoring and decisions as find_matches, but stores results as one
+    array per field (see MatchResultBatch) instead of a MatchResult object
+    per pair - far less memory on large pair counts, and downstream masks
+    run vectorized.
+    """
+    config = config or PipelineConfig()
+
+    pairs = get_candidate_pairs(records, use_soundex=config.use_soundex_blocking)
+    n = len(pairs)
+
+    scores_list = _score_pairs(pairs, n_workers=config.n_workers)
+    decisions, confidences = classify_matches_batch(scores_list, config)
+
+    # Scores live in [0, 1]; float32 columns halve the batch's memory
+    # traffic with precision error far below any classification threshold.
+    # Decisions and confidences are computed in float64 before quantizing
+    npi_match = np.fromiter(
+        (np.nan if s.npi_match is None else s.npi_match for s in scores_list),
+        dtype=np.float32,
+        count=n,
+    )
+    name_similarity = np.fromiter(
+        (s.name_similarity for s in scores_list), dtype=np.float32, count=n
+    )
+    specialty_match = np.fromiter(
+        (np.nan if s.specialty_match is None else s.specialty_match for s in scores_list),
+        dtype=np.float32,
+        count=n,
+    )
+    location_score = np.fromiter(
+        (s.location_score for s in scores_list), dtype=np.float32, count=n
+    )
+
+    batch = MatchResultBatch(
+        source_id_1=np.array([r1.source_id for r1, _ in pairs], dtype=object),
+        source_id_2=np.array([r2.source_id for _, r2 in pairs], dtype=object),
+        npi_match=npi_match,
+        name_similarity=name_similarity,
+        specialty_match=specialty_match,
+        location_score=location_score,
+        overall_score=overall_scores_batch(
+            npi_match, name_similarity, location_score, specialty_match
+        ).astype(np.float32),
+        decision=np.fromiter(
+            (DECISION_CODES.index(d) for d in decisions), dtype=np.int8, count=n
+        ),
+        confidence=np.asarray(confidences, dtype=np.float32),
+        match_type=determine_match_types_batch(
+            npi_match, name_similarity, specialty_match, location_score
+        ),
+    )
+
+    logger.info(
+        f"Classification complete: {int((batch.decision == 1).sum())} matches, "
+        f"{int((batch.decision == 0).sum())} non-matches, "
+        f"{int((batch.decision == 2).sum())} uncertain"
+    )
+
+    return batch
+
+
 def get_confirmed_matches(
     results: list[MatchResult],
     include_uncertain: bool = False,
@@ -0,0 +1,82 @@
+"""MinHash/LSH prefilter for oversized blocking groups."""
+
+from zlib import crc32
+
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger("matching.lsh")
+
+# Large Mersenne prime for the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# Hash-family parameters are drawn once from a fixed seed so signatures are
+# stable across calls and processes
+_RNG_SEED = 0x5EED
+
+
+def _shingle_hashes(key: str, width: int = 3) -> np.ndarray:
+    """Hash the character n-gram shingles of a key to uint64."""
+    if len(key) < width:
+        shingles = [key] if key else []
+    else:
+        shingles = [key[i : i + width] for i in range(len(key) - width + 1)]
+    return np.fromiter(
+        (crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles)
+    )
+
+
+def minhash_signatures(keys: list[str], num_perm: int = 64) -> np.ndarray:
+    """
+    MinHash signature matrix (len(keys) x num_perm) over 3-gram shingles.
+
+    Each permutation is a universal hash (a*x + b) mod p applied to the
+    shingle hashes; the row minimum estimates the permuted set minimum, so
+    matching signature fractions estimate Jaccard similarity.
+    """
+    rng = np.random.default_rng(_RNG_SEED)
+    a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(keys), num_perm), _MERSENNE_PRIME, dtype=np.uint64)
+    for row, key in enumerate(keys):
+        hashes = _shingle_hashes(key)
+        if hashes.size:
+            # One (shingles x perms) broadcast per key; min over shingles
+            permuted = (hashes[:, None] * a + b) % _MERSENNE_PRIME
+            signatures[row] = permuted.min(axis=0)
+    return signatures
+
+
+def lsh_candidate_positions(
+    keys: list[str],
+    num_perm: int = 64,
+    bands: int = 8,
+) -> list[tuple[int, int]]:
+    """
+    Candidate (i, j) position pairs whose keys are likely near-duplicates.
+
+    Signatures are split into bands; rows agreeing on any whole band land in
+    the same bucket and become candidates. With 64 permutations in 8 bands
+    the match probability crosses 50% near Jaccard 0.3, so dissimilar pairs
+    in a large block are never scored while near-duplicates still surface.
+    """
+    signatures = minhash_signatures(keys, num_perm=num_perm)
+    rows_per_band = num_perm // bands
+
+    pairs: set[tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: dict[bytes, list[int]] = {}
+        band_slice = signatures[:, band * rows_per_band : (band + 1) * rows_per_band]
+        for row in range(len(keys)):
+            buckets.setdefault(band_slice[row].tobytes(), []).append(row)
+        for members in buckets.values():
+            for idx, i in enumerate(members):
+                for j in members[idx + 1 :]:
+                    pairs.add((i, j) if i < j else (j, i))
+
+    logger.debug(
+        "LSH prefilter: %d candidate pairs from %d keys", len(pairs), len(keys)
+    )
+    return sorted(pairs)
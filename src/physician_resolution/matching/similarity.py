@@ -1,15 +1,49 @@
 """Pairwise similarity scoring between physician records."""
 
-import jellyfish
-from rapidfuzz import fuzz
+import functools
+import sys
+from bisect import bisect_right
 
-from ..etl.geocoder import calculate_distance_miles
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import JaroWinkler
+
+from ..etl.geocoder import calculate_distance_miles, calculate_distance_miles_vec
 from ..logging import get_logger
 from ..schemas.matches import SimilarityScores
-from ..schemas.records import PhysicianRecord
+from ..schemas.records import PhysicianRecord, RecordColumns, normalize_name_token
 
 logger = get_logger("matching.similarity")
 
+# Distance buckets for location scoring: < 0.5 mi same location, < 10 same
+# city, < 50 same metro, < 100 same region, beyond that different areas
+_DISTANCE_EDGES = (0.5, 10.0, 50.0, 100.0)
+_DISTANCE_SCORES = (1.0, 0.8, 0.5, 0.3, 0.1)
+_DISTANCE_EDGES_ARR = np.array(_DISTANCE_EDGES)
+_DISTANCE_SCORES_ARR = np.array(_DISTANCE_SCORES)
+
+# Common abbreviation mappings for specialties
+_SPECIALTY_MAPPINGS = {
+    "INTERNAL MEDICINE": ["INTERNAL MED", "INT MEDICINE", "IM"],
+    "FAMILY MEDICINE": ["FAMILY MED", "FAMILY PRACTICE", "FP"],
+    "CARDIOLOGY": ["CARDIOVASCULAR DISEASE", "CARDIOVASCULAR MED", "CV"],
+    "ORTHOPEDIC SURGERY": ["ORTHOPAEDIC SURGERY", "ORTHOPEDICS", "ORTHO"],
+    "GENERAL SURGERY": ["SURGERY", "GEN SURGERY"],
+    "PEDIATRICS": ["PEDIATRIC MEDICINE", "PEDS"],
+    "OBSTETRICS & GYNECOLOGY": ["OB/GYN", "OB-GYN", "OBSTETRICS AND GYNECOLOGY"],
+    "GASTROENTEROLOGY": ["GI", "GASTRO", "GI MEDICINE"],
+    "EMERGENCY MEDICINE": ["ER", "EMERGENCY MED", "EM"],
+}
+
+# Flattened variant -> canonical lookup, built once at import so
+# canonicalization is a dict probe instead of a scan over every mapping.
+# Canonical strings are interned so repeat equality checks compare pointers
+_VARIANT_TO_CANONICAL = {
+    variant: sys.intern(canonical)
+    for canonical, variants in _SPECIALTY_MAPPINGS.items()
+    for variant in (canonical, *variants)
+}
+
 
 def calculate_name_similarity(name1: str | None, name2: str | None) -> float:
     """
@@ -31,7 +65,7 @@ def calculate_name_similarity(name1: str | None, name2: str | None) -> float:
         return 1.0
 
     # Jaro-Winkler similarity (0-1)
-    jaro = jellyfish.jaro_winkler_similarity(name1, name2)
+    jaro = JaroWinkler.similarity(name1, name2)
 
     # Token sort ratio (handles reordering like "John Smith" vs "Smith, John")
     token_sort = fuzz.token_sort_ratio(name1, name2) / 100.0
@@ -45,6 +79,37 @@ def calculate_name_similarity(name1: str | None, name2: str | None) -> float:
     return min(score, 1.0)
 
 
+def calculate_name_similarity_matrix(
+    names1: list[str | None],
+    names2: list[str | None],
+) -> np.ndarray:
+    """
+    Name similarity for every (names1[i], names2[j]) pair as a float32 matrix.
+
+    Same weighted Jaro-Winkler / token-sort / partial-ratio blend as
+    calculate_name_similarity, but each metric runs as one multithreaded
+    rapidfuzz.process.cdist call over the whole block instead of a Python
+    call per pair. Names are upper-stripped once per side; missing names
+    score 0.0, matching the scalar guard.
+    """
+    a = [name.upper().strip() if name else "" for name in names1]
+    b = [name.upper().strip() if name else "" for name in names2]
+
+    jaro = process.cdist(a, b, scorer=JaroWinkler.similarity, workers=-1, dtype=np.float32)
+    token_sort = process.cdist(a, b, scorer=fuzz.token_sort_ratio, workers=-1, dtype=np.float32)
+    partial = process.cdist(a, b, scorer=fuzz.partial_ratio, workers=-1, dtype=np.float32)
+
+    scores = jaro * np.float32(0.4) + token_sort * np.float32(0.004) + partial * np.float32(0.002)
+    np.minimum(scores, np.float32(1.0), out=scores)
+
+    empty_a = np.fromiter((not name for name in a), dtype=bool, count=len(a))
+    empty_b = np.fromiter((not name for name in b), dtype=bool, count=len(b))
+    scores[empty_a, :] = 0.0
+    scores[:, empty_b] = 0.0
+
+    return scores
+
+
 def calculate_first_name_similarity(first1: str | None, first2: str | None) -> float:
     """Calculate first name similarity, handling initials."""
     if not first1 or not first2:
@@ -64,26 +129,33 @@ def calculate_first_name_similarity(first1: str | None, first2: str | None) -> f
         return 0.8
 
     # String similarity
-    return jellyfish.jaro_winkler_similarity(f1, f2)
+    return JaroWinkler.similarity(f1, f2)
 
 
 def calculate_last_name_similarity(last1: str | None, last2: str | None) -> float:
     """Calculate last name similarity."""
-    if not last1 or not last2:
-        return 0.0  # Last name is critical
+    return _last_name_similarity_norm(normalize_name_token(last1), normalize_name_token(last2))
 
-    l1 = last1.upper().strip()
-    l2 = last2.upper().strip()
 
-    # Normalize: remove apostrophes, hyphens for comparison
-    l1_norm = l1.replace("'", "").replace("-", "").replace(" ", "")
-    l2_norm = l2.replace("'", "").replace("-", "").replace(" ", "")
+def _last_name_similarity_norm(l1_norm: str | None, l2_norm: str | None) -> float:
+    """Last name similarity over pre-normalized keys (see normalize_name_token)."""
+    if not l1_norm or not l2_norm:
+        return 0.0  # Last name is critical
 
     if l1_norm == l2_norm:
         return 1.0
 
-    # Jaro-Winkler for typos
-    return jellyfish.jaro_winkler_similarity(l1_norm, l2_norm)
+    # Distinct name pairs repeat across many record comparisons; memoize the
+    # Jaro-Winkler call, order-normalized since the metric is symmetric
+    if l2_norm < l1_norm:
+        l1_norm, l2_norm = l2_norm, l1_norm
+    return _jaro_winkler_cached(l1_norm, l2_norm)
+
+
+@functools.lru_cache(maxsize=1 << 20)
+def _jaro_winkler_cached(s1: str, s2: str) -> float:
+    """Jaro-Winkler for typos, memoized on the (ordered) string pair."""
+    return JaroWinkler.similarity(s1, s2)
 
 
 def calculate_location_score(
@@ -104,20 +176,12 @@ def calculate_location_score(
     - Same state: 0.3
     - Different state: 0.1
     """
-    # Try distance-based scoring first
+    # Try distance-based scoring first; one binary search over the bucket
+    # edges replaces the compare ladder
     distance = calculate_distance_miles(lat1, lon1, lat2, lon2)
 
     if distance is not None:
-        if distance < 0.5:
-            return 1.0
-        elif distance < 10:
-            return 0.8
-        elif distance < 50:
-            return 0.5
-        elif distance < 100:
-            return 0.3
-        else:
-            return 0.1
+        return _DISTANCE_SCORES[bisect_right(_DISTANCE_EDGES, distance)]
 
     # Fall back to state comparison
     if state1 and state2:
@@ -130,6 +194,39 @@ def calculate_location_score(
     return 0.2  # Neutral
 
 
+def calculate_location_scores_batch(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    state1: np.ndarray | None = None,
+    state2: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    calculate_location_score over pair arrays, one vectorized pass.
+
+    Distances come from the vectorized haversine and the bucket thresholds
+    apply via np.select; rows with missing coordinates fall back to the
+    state comparison (or the 0.2 neutral score), matching the scalar
+    function element for element.
+    """
+    distances = calculate_distance_miles_vec(lat1, lon1, lat2, lon2)
+
+    # State fallback for rows without usable coordinates
+    if state1 is not None and state2 is not None:
+        s1 = np.array([s.upper() if s else "" for s in state1], dtype=object)
+        s2 = np.array([s.upper() if s else "" for s in state2], dtype=object)
+        has_states = (s1 != "") & (s2 != "")
+        fallback = np.where(has_states, np.where(s1 == s2, 0.3, 0.1), 0.2)
+    else:
+        fallback = np.full(distances.shape, 0.2)
+
+    # Bucketing is one digitize plus a gather; NaN distances land in the
+    # last bin and are overwritten by the fallback
+    scores = _DISTANCE_SCORES_ARR[np.digitize(distances, _DISTANCE_EDGES_ARR)]
+    return np.where(np.isnan(distances), fallback, scores)
+
+
 def calculate_specialty_similarity(spec1: str | None, spec2: str | None) -> float | None:
     """
     Calculate specialty match score.
@@ -138,39 +235,32 @@ def calculate_specialty_similarity(spec1: str | None, spec2: str | None) -> floa
     """
     if not spec1 or not spec2:
         return None
+    return _specialty_similarity_norm(spec1.upper().strip(), spec2.upper().strip())
 
-    s1 = spec1.upper().strip()
-    s2 = spec2.upper().strip()
 
+def _specialty_similarity_norm(s1: str, s2: str) -> float:
+    """Specialty match score over pre-uppercased, stripped strings."""
     # Exact match
     if s1 == s2:
         return 1.0
 
-    # Common abbreviation mappings
-    mappings = {
-        "INTERNAL MEDICINE": ["INTERNAL MED", "INT MEDICINE", "IM"],
-        "FAMILY MEDICINE": ["FAMILY MED", "FAMILY PRACTICE", "FP"],
-        "CARDIOLOGY": ["CARDIOVASCULAR DISEASE", "CARDIOVASCULAR MED", "CV"],
-        "ORTHOPEDIC SURGERY": ["ORTHOPAEDIC SURGERY", "ORTHOPEDICS", "ORTHO"],
-        "GENERAL SURGERY": ["SURGERY", "GEN SURGERY"],
-        "PEDIATRICS": ["PEDIATRIC MEDICINE", "PEDS"],
-        "OBSTETRICS & GYNECOLOGY": ["OB/GYN", "OB-GYN", "OBSTETRICS AND GYNECOLOGY"],
-        "GASTROENTEROLOGY": ["GI", "GASTRO", "GI MEDICINE"],
-        "EMERGENCY MEDICINE": ["ER", "EMERGENCY MED", "EM"],
-    }
+    # Symmetric and pure - memoize on the ordered pair, since the same few
+    # specialty strings recur across the whole corpus
+    if s2 < s1:
+        s1, s2 = s2, s1
+    return _specialty_similarity_cached(s1, s2)
 
-    # Check if they map to the same canonical specialty
-    def get_canonical(spec: str) -> str:
-        for canonical, variants in mappings.items():
-            if spec == canonical or spec in variants:
-                return canonical
-        return spec
 
-    if get_canonical(s1) == get_canonical(s2):
+@functools.lru_cache(maxsize=1 << 16)
+def _specialty_similarity_cached(s1: str, s2: str) -> float:
+
+    # Check if they map to the same canonical specialty
+    if _VARIANT_TO_CANONICAL.get(s1, s1) == _VARIANT_TO_CANONICAL.get(s2, s2):
         return 1.0
 
-    # Fuzzy match
-    similarity = fuzz.ratio(s1, s2) / 100.0
+    # Fuzzy match - the cutoff lets rapidfuzz band-pass on length and bail
+    # out of hopeless pairs before running the full alignment
+    similarity = fuzz.ratio(s1, s2, score_cutoff=80) / 100.0
     if similarity > 0.8:
         return similarity
 
@@ -206,6 +296,26 @@ def calculate_npi_match(npi1: str | None, npi2: str | None) -> float | None:
         return 0.0  # Conflict - definitely different people
 
 
+def overall_scores_batch(
+    npi_match: np.ndarray,
+    name_similarity: np.ndarray,
+    location_score: np.ndarray,
+    specialty_match: np.ndarray,
+) -> np.ndarray:
+    """
+    _calculate_overall_score over component-score arrays, one np.where chain.
+
+    NaN stands in for None in the npi_match and specialty_match columns;
+    missing specialty redistributes its weight to the name score exactly as
+    in the scalar function.
+    """
+    specialty_part = np.where(np.isnan(specialty_match), name_similarity, specialty_match)
+    weighted = np.minimum(
+        name_similarity * 0.5 + location_score * 0.3 + specialty_part * 0.2, 1.0
+    )
+    return np.where(npi_match == 1.0, 0.95, np.where(npi_match == 0.0, 0.0, weighted))
+
+
 def calculate_similarity(
     record1: PhysicianRecord,
     record2: PhysicianRecord,
@@ -215,26 +325,90 @@ def calculate_similarity(
 
     Returns SimilarityScores with component and overall scores.
     """
-    # NPI comparison
-    npi_match = calculate_npi_match(record1.npi, record2.npi)
-
-    # Name similarity
-    last_sim = calculate_last_name_similarity(record1.name_last, record2.name_last)
-    first_sim = calculate_first_name_similarity(record1.name_first, record2.name_first)
-    name_similarity = (last_sim * 0.6) + (first_sim * 0.4)
-
-    # Location score
-    location_score = calculate_location_score(
+    return _similarity_from_fields(
+        record1.npi_int,
+        record2.npi_int,
+        record1.name_last_norm,
+        record2.name_last_norm,
+        record1.name_first,
+        record2.name_first,
         record1.latitude,
         record1.longitude,
         record2.latitude,
         record2.longitude,
         record1.facility_state,
         record2.facility_state,
+        record1.specialty_norm,
+        record2.specialty_norm,
     )
 
-    # Specialty match
-    specialty_match = calculate_specialty_similarity(record1.specialty, record2.specialty)
+
+def calculate_similarity_at(columns: RecordColumns, i: int, j: int) -> SimilarityScores:
+    """
+    calculate_similarity for rows i and j of a columnar record view.
+
+    Reads the fields straight out of the RecordColumns arrays, so callers
+    that already hold the structure-of-arrays form skip materializing two
+    PhysicianRecord objects and their attribute lookups per pair.
+    """
+    col = columns.column
+    return _similarity_from_fields(
+        col("npi_int")[i],
+        col("npi_int")[j],
+        col("name_last_norm")[i],
+        col("name_last_norm")[j],
+        col("name_first")[i],
+        col("name_first")[j],
+        col("latitude")[i],
+        col("longitude")[i],
+        col("latitude")[j],
+        col("longitude")[j],
+        col("facility_state")[i],
+        col("facility_state")[j],
+        col("specialty_norm")[i],
+        col("specialty_norm")[j],
+    )
+
+
+def _similarity_from_fields(
+    npi1: int,
+    npi2: int,
+    last_norm1: str | None,
+    last_norm2: str | None,
+    first1: str | None,
+    first2: str | None,
+    lat1: float | None,
+    lon1: float | None,
+    lat2: float | None,
+    lon2: float | None,
+    state1: str | None,
+    state2: str | None,
+    spec_norm1: str | None,
+    spec_norm2: str | None,
+) -> SimilarityScores:
+    """Score a pair from its already-extracted record fields."""
+    # NPI comparison over the integer keys parsed at record construction -
+    # 0 means missing/malformed, mirroring calculate_npi_match's None
+    if npi1 == 0 or npi2 == 0:
+        npi_match = None
+    else:
+        npi_match = 1.0 if npi1 == npi2 else 0.0
+
+    # Name similarity - last names read the keys normalized at record
+    # construction instead of redoing upper/strip per comparison
+    last_sim = _last_name_similarity_norm(last_norm1, last_norm2)
+    first_sim = calculate_first_name_similarity(first1, first2)
+    name_similarity = (last_sim * 0.6) + (first_sim * 0.4)
+
+    # Location score
+    location_score = calculate_location_score(lat1, lon1, lat2, lon2, state1, state2)
+
+    # Specialty match, over the specialty keys cached on the records
+    specialty_match = (
+        _specialty_similarity_norm(spec_norm1, spec_norm2)
+        if spec_norm1 and spec_norm2
+        else None
+    )
 
     # Calculate overall score
     overall_score = _calculate_overall_score(
@@ -272,20 +446,12 @@ def _calculate_overall_score(
     if npi_match == 0.0:
         return 0.0
 
-    # No NPI - weight other factors
-    weights = {
-        "name": 0.50,
-        "location": 0.30,
-        "specialty": 0.20,
-    }
-
-    score = name_similarity * weights["name"]
-    score += location_score * weights["location"]
-
-    if specialty_match is not None:
-        score += specialty_match * weights["specialty"]
+    # No NPI - weight other factors (name 0.5, location 0.3, specialty 0.2).
+    # Both arms are flat constant folds; the missing-specialty arm has the
+    # redistributed specialty weight pre-added to the name weight
+    if specialty_match is None:
+        score = name_similarity * 0.7 + location_score * 0.3
     else:
-        # Redistribute specialty weight to name
-        score += name_similarity * weights["specialty"]
+        score = name_similarity * 0.5 + location_score * 0.3 + specialty_match * 0.2
 
     return min(score, 1.0)
@@ -32,50 +32,52 @@ def build_referral_graph(
     """
     G = nx.DiGraph()
 
-    # Aggregate referrals
-    referral_counts: dict[tuple[str, str], int] = defaultdict(int)
-    referral_dates: dict[tuple[str, str], str] = {}
-
-    for _, row in referrals_df.iterrows():
-        referring_npi = row.get("referring_npi")
-        receiving_npi = row.get("receiving_npi")
-        referral_date = row.get("referral_date", "")
-
-        # Skip if NPIs are missing or invalid
-        if not referring_npi or not receiving_npi:
-            continue
-        if pd.isna(referring_npi) or pd.isna(receiving_npi):
-            continue
-
-        # Map to canonical IDs
-        referring_id = canonical_mapping.get(referring_npi)
-        receiving_id = canonical_mapping.get(receiving_npi)
-
-        # Skip if we can't resolve either physician
-        if not referring_id or not receiving_id:
-            continue
-
-        # Skip self-referrals
-        if referring_id == receiving_id:
-            continue
-
-        edge_key = (referring_id, receiving_id)
-        referral_counts[edge_key] += 1
-
-        # Track most recent date
-        if referral_date:
-            current_date = referral_dates.get(edge_key, "")
-            if referral_date > current_date:
-                referral_dates[edge_key] = referral_date
-
-    # Build graph
-    for (referring_id, receiving_id), count in referral_counts.items():
-        G.add_edge(
-            referring_id,
-            receiving_id,
-            referral_count=count,
-            last_referral_date=referral_dates.get((referring_id, receiving_id), ""),
-        )
+    referring = referrals_df.get("referring_npi")
+    receiving = referrals_df.get("receiving_npi")
+    if referring is None or receiving is None or referrals_df.empty:
+        logger.info("Built referral graph: 0 physicians, 0 referral relationships")
+        return G
+
+    # Filter, map, and aggregate column-wise - no per-row Python objects.
+    # Rows with missing NPIs, unresolved canonical IDs, or self-referrals
+    # drop out via boolean masks, exactly like the old per-row guards
+    referring_id = referring.map(canonical_mapping)
+    receiving_id = receiving.map(canonical_mapping)
+    valid = (
+        referring.notna()
+        & receiving.notna()
+        & (referring != "")
+        & (receiving != "")
+        & referring_id.notna()
+        & receiving_id.notna()
+        & (referring_id != "")
+        & (receiving_id != "")
+        & (referring_id != receiving_id)
+    )
+
+    dates = referrals_df.get("referral_date")
+    edges = pd.DataFrame(
+        {
+            "referring_id": referring_id[valid],
+            "receiving_id": receiving_id[valid],
+            "referral_date": dates[valid].fillna("") if dates is not None else "",
+        }
+    )
+
+    # One C-level groupby replaces the per-row count/max-date dicts, and the
+    # aggregated edge list loads in bulk via from_pandas_edgelist
+    agg = edges.groupby(["referring_id", "receiving_id"], sort=False).agg(
+        referral_count=("referral_date", "size"),
+        last_referral_date=("referral_date", "max"),
+    )
+
+    G = nx.from_pandas_edgelist(
+        agg.reset_index(),
+        source="referring_id",
+        target="receiving_id",
+        edge_attr=["referral_count", "last_referral_date"],
+        create_using=nx.DiGraph,
+    )
 
     logger.info(
         f"Built referral graph: {G.number_of_nodes()} physicians, "
@@ -110,13 +112,20 @@ def get_referral_stats(G: nx.DiGraph) -> dict:
     if G.number_of_nodes() == 0:
         return {"error": "Empty graph"}
 
+    # Several reports ask for the same stats; memoize on the graph object,
+    # stamped with its size so mutation invalidates the entry
+    stamp = (G.number_of_nodes(), G.number_of_edges())
+    cached = G.graph.get("_stats_cache")
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     in_degrees = dict(G.in_degree())
     out_degrees = dict(G.out_degree())
 
     # Referral volumes
     volumes = [d.get("referral_count", 0) for _, _, d in G.edges(data=True)]
 
-    return {
+    stats = {
         "num_physicians": G.number_of_nodes(),
         "num_relationships": G.number_of_edges(),
         "total_referrals": sum(volumes),
@@ -126,6 +135,8 @@ def get_referral_stats(G: nx.DiGraph) -> dict:
         "avg_in_degree": sum(in_degrees.values()) / len(in_degrees) if in_degrees else 0,
         "avg_out_degree": sum(out_degrees.values()) / len(out_degrees) if out_degrees else 0,
     }
+    G.graph["_stats_cache"] = (stamp, stats)
+    return stats
 
 
 def get_top_referrers(G: nx.DiGraph, n: int = 10) -> list[tuple[str, int]]:
@@ -3,12 +3,14 @@
 import json
 from pathlib import Path
 
+import pandas as pd
+
 from .analysis import (
     generate_cluster_report,
     generate_data_quality_report,
     generate_match_quality_report,
 )
-from .canonicalization import assign_canonical_ids, merge_all_clusters
+from .canonicalization import assign_canonical_ids, generate_canonical_ids, merge_all_clusters
 from .config import PipelineConfig, get_run_output_dir
 from .etl import load_all_sources, normalize_all
 from .graph import build_identity_graph, find_clusters, full_pruning_pipeline
@@ -103,8 +105,9 @@ def run_pipeline(
 
     # Step 7: Canonicalize
     logger.info("Step 7: Canonicalizing entities...")
-    canonical_mapping = assign_canonical_ids(G, clusters)
-    canonical_physicians = merge_all_clusters(G, clusters)
+    canonical_ids = generate_canonical_ids(G, clusters)
+    canonical_mapping = assign_canonical_ids(G, clusters, canonical_ids)
+    canonical_physicians = merge_all_clusters(G, clusters, canonical_ids)
     results["canonical_physician_count"] = len(canonical_physicians)
 
     # Step 8: Referral network
@@ -165,54 +168,41 @@ def _export_results(
     exports_dir.mkdir(parents=True, exist_ok=True)
     reports_dir.mkdir(parents=True, exist_ok=True)
 
-    # Export canonical physicians
-    import csv
-
-    with open(exports_dir / "canonical_physicians.csv", "w", newline="") as f:
-        fieldnames = [
-            "canonical_id",
-            "npi",
-            "name",
-            "specialty",
-            "primary_facility",
-            "city",
-            "state",
-            "confidence",
-            "source_count",
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for phys in canonical_physicians:
-            writer.writerow(
-                {
-                    "canonical_id": phys.canonical_id,
-                    "npi": phys.npi,
-                    "name": phys.name,
-                    "specialty": phys.specialty,
-                    "primary_facility": phys.primary_facility,
-                    "city": phys.city,
-                    "state": phys.state,
-                    "confidence": phys.confidence,
-                    "source_count": phys.source_count,
-                }
-            )
+    # Export canonical physicians - columns are pulled from the dataclasses
+    # in one pass and written by pandas' C csv writer instead of a
+    # dict-per-row DictWriter loop
+    canonical_df = pd.DataFrame(
+        {
+            "canonical_id": [phys.canonical_id for phys in canonical_physicians],
+            "npi": [phys.npi for phys in canonical_physicians],
+            "name": [phys.name for phys in canonical_physicians],
+            "specialty": [phys.specialty for phys in canonical_physicians],
+            "primary_facility": [phys.primary_facility for phys in canonical_physicians],
+            "city": [phys.city for phys in canonical_physicians],
+            "state": [phys.state for phys in canonical_physicians],
+            "confidence": [phys.confidence for phys in canonical_physicians],
+            "source_count": [phys.source_count for phys in canonical_physicians],
+        }
+    )
+    canonical_df.to_csv(exports_dir / "canonical_physicians.csv", index=False)
 
     # Export mapping
-    with open(exports_dir / "source_to_canonical_mapping.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["source_id", "canonical_id"])
-        for source_id, canonical_id in canonical_mapping.items():
-            writer.writerow([source_id, canonical_id])
+    pd.DataFrame(
+        {
+            "source_id": list(canonical_mapping.keys()),
+            "canonical_id": list(canonical_mapping.values()),
+        }
+    ).to_csv(exports_dir / "source_to_canonical_mapping.csv", index=False)
 
     # Export influence scores
     if influence_scores:
-        with open(exports_dir / "influence_scores.csv", "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["canonical_id", "influence_score"])
-            for phys_id, score in sorted(
-                influence_scores.items(), key=lambda x: x[1], reverse=True
-            ):
-                writer.writerow([phys_id, score])
+        scores_df = pd.DataFrame(
+            {
+                "canonical_id": list(influence_scores.keys()),
+                "influence_score": list(influence_scores.values()),
+            }
+        ).sort_values("influence_score", ascending=False)
+        scores_df.to_csv(exports_dir / "influence_scores.csv", index=False)
 
     # Export reports
     for report_name, report_data in reports.items():
@@ -2,15 +2,17 @@
 
 from .clusters import ClusterQuality
 from .entities import CanonicalPhysician
-from .matches import MatchDecision, MatchResult, SimilarityScores
-from .records import ParsedName, PhysicianRecord
+from .matches import MatchDecision, MatchResult, MatchResultBatch, SimilarityScores
+from .records import ParsedName, PhysicianRecord, RecordColumns
 
 __all__ = [
     "ParsedName",
     "PhysicianRecord",
+    "RecordColumns",
     "SimilarityScores",
     "MatchDecision",
     "MatchResult",
+    "MatchResultBatch",
     "ClusterQuality",
     "CanonicalPhysician",
 ]
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 
+from .records import field_dict_method
 
-@dataclass
+
+@dataclass(slots=True)
 class CanonicalPhysician:
     """Resolved canonical physician entity."""
 
@@ -19,17 +21,6 @@ class CanonicalPhysician:
     source_records: list[str] = field(default_factory=list)
     source_count: int = 0
 
-    def to_dict(self) -> dict:
-        return {
-            "canonical_id": self.canonical_id,
-            "confidence": self.confidence,
-            "npi": self.npi,
-            "name": self.name,
-            "specialty": self.specialty,
-            "primary_facility": self.primary_facility,
-            "city": self.city,
-            "state": self.state,
-            "all_facilities": self.all_facilities,
-            "source_records": self.source_records,
-            "source_count": self.source_count,
-        }
+
+# Specialized dict literal generated once at import (see field_dict_method)
+CanonicalPhysician.to_dict = field_dict_method(CanonicalPhysician)
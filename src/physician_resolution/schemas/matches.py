@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+from .records import field_dict_method
+
 
 class MatchDecision(Enum):
     """Classification of a potential match."""
@@ -10,7 +14,7 @@ class MatchDecision(Enum):
     UNCERTAIN = "uncertain"
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityScores:
     """Similarity scores between two physician records."""
 
@@ -20,17 +24,12 @@ class SimilarityScores:
     location_score: float = 0.0  # Based on distance
     overall_score: float = 0.0  # Weighted combination
 
-    def to_dict(self) -> dict:
-        return {
-            "npi_match": self.npi_match,
-            "name_similarity": self.name_similarity,
-            "specialty_match": self.specialty_match,
-            "location_score": self.location_score,
-            "overall_score": self.overall_score,
-        }
 
+# Specialized dict literal generated once at import (see field_dict_method)
+SimilarityScores.to_dict = field_dict_method(SimilarityScores)
 
-@dataclass
+
+@dataclass(slots=True)
 class MatchResult:
     """Result of comparing two records."""
 
@@ -40,3 +39,70 @@ class MatchResult:
     decision: MatchDecision
     confidence: float
     match_type: str  # "npi_exact", "name_location", "name_only", etc.
+
+
+# Decision for each int8 code stored in MatchResultBatch.decision
+DECISION_CODES = (MatchDecision.NON_MATCH, MatchDecision.MATCH, MatchDecision.UNCERTAIN)
+
+
+@dataclass
+class MatchResultBatch:
+    """
+    Columnar (structure-of-arrays) match results.
+
+    One array per field instead of one MatchResult object per pair: masks
+    and reductions run vectorized, decisions are int8 codes into
+    DECISION_CODES, score columns are float32 (ample for values in [0, 1]),
+    and MatchResult objects are materialized only on demand.
+    """
+
+    source_id_1: np.ndarray
+    source_id_2: np.ndarray
+    npi_match: np.ndarray  # NaN where missing
+    name_similarity: np.ndarray
+    specialty_match: np.ndarray  # NaN where missing
+    location_score: np.ndarray
+    overall_score: np.ndarray
+    decision: np.ndarray  # int8 codes into DECISION_CODES
+    confidence: np.ndarray
+    match_type: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.source_id_1)
+
+    def confirmed_matches(self, include_uncertain: bool = False) -> list[tuple[str, str, float]]:
+        """Confirmed (source_id_1, source_id_2, overall_score) tuples via one mask."""
+        mask = self.decision == DECISION_CODES.index(MatchDecision.MATCH)
+        if include_uncertain:
+            mask |= self.decision == DECISION_CODES.index(MatchDecision.UNCERTAIN)
+        return list(
+            zip(self.source_id_1[mask], self.source_id_2[mask], self.overall_score[mask])
+        )
+
+    def __getitem__(self, i: int) -> MatchResult:
+        """Materialize the MatchResult for one pair on demand.
+
+        Lets object-API callers index or iterate the batch lazily without
+        ever holding a full list of MatchResult objects in memory.
+        """
+        specialty = self.specialty_match[i]
+        npi = self.npi_match[i]
+        scores = SimilarityScores(
+            npi_match=None if np.isnan(npi) else float(npi),
+            name_similarity=float(self.name_similarity[i]),
+            specialty_match=None if np.isnan(specialty) else float(specialty),
+            location_score=float(self.location_score[i]),
+            overall_score=float(self.overall_score[i]),
+        )
+        return MatchResult(
+            source_id_1=self.source_id_1[i],
+            source_id_2=self.source_id_2[i],
+            scores=scores,
+            decision=DECISION_CODES[self.decision[i]],
+            confidence=float(self.confidence[i]),
+            match_type=self.match_type[i],
+        )
+
+    def to_results(self) -> list[MatchResult]:
+        """Materialize per-pair MatchResult objects for object-API callers."""
+        return [self[i] for i in range(len(self))]
@@ -1,9 +1,60 @@
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, fields
 
+import numpy as np
 
-@dataclass
+# Integer codes for each source, assigned at ingest so hot paths can index
+# NumPy tables instead of hashing source strings
+SOURCE_CODES = {"cms": 0, "license": 1, "hospital": 2, "publication": 3}
+
+# Code for sources outside the known set
+UNKNOWN_SOURCE_CODE = len(SOURCE_CODES)
+
+# Reliability multiplier per source code (last entry covers unknown sources):
+# CMS has NPI (most reliable), state licenses are authoritative, hospital
+# directories vary in quality, publications have abbreviated names
+SOURCE_RELIABILITY = np.array([1.0, 0.9, 0.8, 0.6, 0.5], dtype=np.float64)
+
+# Characters stripped when building normalized name keys
+_NAME_NORM_STRIP = str.maketrans("", "", "-' ")
+
+
+def field_dict_method(cls):
+    """
+    Build a specialized to_dict for a dataclass via exec at import time.
+
+    The generated body is one dict literal over the class's fields, which
+    compiles to a single BUILD_MAP instead of a per-call loop over a field
+    tuple - the same trick dataclasses uses for __init__. Assign the result
+    as a class attribute: ``cls.to_dict = field_dict_method(cls)``.
+    """
+    body = ", ".join(f"{f.name!r}: self.{f.name}" for f in fields(cls))
+    namespace: dict = {}
+    exec(f"def to_dict(self):\n    return {{{body}}}", namespace)
+    method = namespace["to_dict"]
+    method.__doc__ = f"Return this {cls.__name__}'s fields as a dict."
+    return method
+
+
+def normalize_name_token(value: str | None) -> str | None:
+    """
+    Uppercase a name token and strip hyphens, apostrophes, and spaces.
+
+    Results are interned, so equality checks on normalized names are usually
+    pointer compares.
+    """
+    if not value:
+        return None
+    return sys.intern(value.upper().translate(_NAME_NORM_STRIP))
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedName:
-    """Parsed components of a physician name."""
+    """Parsed components of a physician name.
+
+    Frozen so parsed results are hashable and safe to memoize.
+    """
 
     first: str | None = None
     last: str | None = None
@@ -26,7 +77,7 @@ class ParsedName:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicianRecord:
     """Normalized physician record from any source."""
 
@@ -55,16 +106,109 @@ class PhysicianRecord:
     latitude: float | None = None
     longitude: float | None = None
 
+    # Normalized name and specialty keys, derived once at construction so
+    # matching does a single equality check instead of rebuilding the key
+    # per comparison
+    name_last_norm: str | None = None
+    name_first_norm: str | None = None
+    specialty_norm: str | None = None
+
+    # NPI parsed to an integer (0 for missing or malformed), so the
+    # per-pair NPI check is one int compare instead of strip/isdigit calls
+    npi_int: int = 0
+
+    # Lazily cached standardized_name; excluded from comparisons so caching
+    # never changes record equality
+    _std_name: str | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Low-cardinality fields are interned so millions of records share
+        # one allocation per distinct value and blocking's dict lookups hit
+        # pointer-equal keys
+        self.source = sys.intern(self.source)
+        if self.facility_state:
+            self.facility_state = sys.intern(self.facility_state)
+        if self.name_suffix:
+            self.name_suffix = sys.intern(self.name_suffix)
+        if self.name_last_norm is None:
+            self.name_last_norm = normalize_name_token(self.name_last)
+        if self.name_first_norm is None:
+            self.name_first_norm = normalize_name_token(self.name_first)
+        if self.specialty_norm is None and self.specialty:
+            self.specialty_norm = sys.intern(self.specialty.upper().strip())
+        if self.npi_int == 0 and self.npi:
+            npi = self.npi.strip()
+            if len(npi) == 10 and npi.isdigit():
+                self.npi_int = int(npi)
+
+    @property
+    def source_code(self) -> int:
+        """Integer code for this record's source (see SOURCE_CODES)."""
+        return SOURCE_CODES.get(self.source, UNKNOWN_SOURCE_CODE)
+
     def standardized_name(self) -> str:
-        """Return standardized name format."""
-        parts = []
-        if self.name_last:
-            parts.append(self.name_last.upper())
-        if self.name_first:
-            first_part = self.name_first.upper()
-            if self.name_middle:
-                first_part += f" {self.name_middle[0].upper()}"
-            if parts:
-                parts[0] += ","
-            parts.append(first_part)
-        return " ".join(parts)
+        """Return standardized name format, computed once per record."""
+        if self._std_name is None:
+            parts = []
+            if self.name_last:
+                parts.append(self.name_last.upper())
+            if self.name_first:
+                first_part = self.name_first.upper()
+                if self.name_middle:
+                    first_part += f" {self.name_middle[0].upper()}"
+                if parts:
+                    parts[0] += ","
+                parts.append(first_part)
+            self._std_name = " ".join(parts)
+        return self._std_name
+
+
+_RECORD_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(PhysicianRecord))
+
+
+class RecordColumns:
+    """
+    Structure-of-arrays view over physician records.
+
+    Each record field is stored as one NumPy array, so column-wise passes
+    (blocking on last name, NPI comparisons, distance computations) scan
+    contiguous storage instead of touching one attribute dict per record.
+    PhysicianRecord objects are only materialized on demand via
+    iter_records()/record_at().
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        self.columns = columns
+        # Positional index: source_id -> row number
+        self.source_id_to_pos = {sid: i for i, sid in enumerate(columns["source_id"])}
+
+    @classmethod
+    def from_records(cls, records: Iterable[PhysicianRecord]) -> "RecordColumns":
+        """Build columnar storage from a record list (or iterator)."""
+        records = list(records)
+        columns = {
+            name: np.array([getattr(r, name) for r in records], dtype=object)
+            for name in _RECORD_FIELDS
+        }
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["source_id"])
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the array for one record field."""
+        return self.columns[name]
+
+    def positions(self, source_ids: Iterable[str]) -> np.ndarray:
+        """Map source IDs to row positions as an int64 array."""
+        lookup = self.source_id_to_pos
+        return np.fromiter((lookup[sid] for sid in source_ids), dtype=np.int64)
+
+    def record_at(self, pos: int) -> PhysicianRecord:
+        """Materialize the record at one row position."""
+        return PhysicianRecord(**{name: self.columns[name][pos] for name in _RECORD_FIELDS})
+
+    def iter_records(self) -> Iterator[PhysicianRecord]:
+        """Lazily materialize PhysicianRecord objects row by row."""
+        for pos in range(len(self)):
+            yield self.record_at(pos)
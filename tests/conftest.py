@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Add src to path
@@ -10,6 +11,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from physician_resolution.schemas.records import ParsedName, PhysicianRecord
 
+_SURNAMES = [f"SURNAME{i:04d}" for i in range(1000)]
+_FIRST_NAMES = ["JOHN", "MARY", "JAMES", "LINDA", "ROBERT", "PATRICIA", "DAVID", "SUSAN"]
+_STATES = ["MA", "NY", "CA", "TX", "FL", "IL", "PA", "OH", "GA", "NC"]
+_SPECIALTIES = ["Internal Medicine", "Cardiology", "Pediatrics", "Dermatology", None]
+
 
 @pytest.fixture
 def sample_physician_record():
@@ -103,6 +109,56 @@ def sample_matches():
     ]
 
 
+@pytest.fixture
+def make_records():
+    """Factory for deterministic synthetic record sets of arbitrary size.
+
+    Surnames follow a Zipf draw over a 1000-name vocabulary so blocking
+    sees realistic skew (a few very common names, a long tail); tests that
+    need to exercise scale can generate thousands of records without
+    hand-writing fixtures.
+    """
+
+    def _make(n: int, seed: int = 0) -> list[PhysicianRecord]:
+        rng = np.random.default_rng(seed)
+        surname_idx = np.minimum(rng.zipf(1.3, size=n) - 1, len(_SURNAMES) - 1)
+        npis = rng.integers(1_000_000_000, 10_000_000_000, size=n)
+        has_npi = rng.random(n) < 0.6
+        return [
+            PhysicianRecord(
+                source=["cms", "license", "hospital"][i % 3],
+                source_id=f"syn_{i:07d}",
+                npi=str(npis[i]) if has_npi[i] else None,
+                name_first=_FIRST_NAMES[i % len(_FIRST_NAMES)],
+                name_last=_SURNAMES[surname_idx[i]],
+                specialty=_SPECIALTIES[i % len(_SPECIALTIES)],
+                facility_state=_STATES[i % len(_STATES)],
+            )
+            for i in range(n)
+        ]
+
+    return _make
+
+
+@pytest.fixture
+def make_matches():
+    """Factory for sparse synthetic match tuples over a record set."""
+
+    def _make(records: list[PhysicianRecord], density: float = 0.001, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        n = len(records)
+        count = max(1, int(n * (n - 1) / 2 * density))
+        matches = []
+        for _ in range(count):
+            i, j = rng.choice(n, size=2, replace=False)
+            matches.append(
+                (records[i].source_id, records[j].source_id, round(float(rng.uniform(0.5, 1.0)), 3))
+            )
+        return matches
+
+    return _make
+
+
 @pytest.fixture
 def sample_parsed_name():
     """Create a sample parsed name."""
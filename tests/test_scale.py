@@ -0,0 +1,86 @@
+"""Scale tests driving the pipeline with the synthetic record factories."""
+
+import jellyfish
+import networkx as nx
+import pytest
+
+from physician_resolution.graph.builder import build_identity_graph
+from physician_resolution.graph.clustering import find_clusters
+from physician_resolution.matching.blocking import get_candidate_pairs
+
+
+def _expected_pairs(records):
+    """Brute-force the blocking union: same NPI, last+state, or soundex+state."""
+    expected = set()
+    for i, r1 in enumerate(records):
+        for r2 in records[i + 1 :]:
+            same_npi = r1.npi is not None and r1.npi == r2.npi
+            same_state = (r1.facility_state or "XX").upper() == (r2.facility_state or "XX").upper()
+            same_last = r1.name_last.upper().strip() == r2.name_last.upper().strip()
+            same_soundex = jellyfish.soundex(r1.name_last) == jellyfish.soundex(r2.name_last)
+            if same_npi or (same_state and (same_last or same_soundex)):
+                expected.add(frozenset((r1.source_id, r2.source_id)))
+    return expected
+
+
+class TestCandidatePairsAtScale:
+    """Tests for blocking over generated record sets."""
+
+    def test_matches_brute_force(self, make_records):
+        """Test blocked pairs equal the brute-force blocking union."""
+        records = make_records(100)
+        pairs = get_candidate_pairs(records)
+
+        found = {frozenset((r1.source_id, r2.source_id)) for r1, r2 in pairs}
+        assert found == _expected_pairs(records)
+
+    @pytest.mark.parametrize("n", [100, 1000])
+    def test_pairs_share_a_blocking_key(self, make_records, n):
+        """Test every pair shares an NPI or a state at scale."""
+        records = make_records(n)
+        pairs = get_candidate_pairs(records)
+        assert len(pairs) > 0
+
+        for rec1, rec2 in pairs:
+            assert rec1.source_id < rec2.source_id
+            # Every non-NPI strategy keys on state, so any pair either
+            # shares an NPI or shares a state
+            assert (rec1.npi is not None and rec1.npi == rec2.npi) or (
+                rec1.facility_state == rec2.facility_state
+            )
+
+    def test_deterministic_for_seed(self, make_records):
+        """Test the factory reproduces the same records for a seed."""
+        assert make_records(200, seed=7) == make_records(200, seed=7)
+        assert make_records(200, seed=7) != make_records(200, seed=8)
+
+
+class TestClusteringAtScale:
+    """Tests for graph building and clustering over generated match sets."""
+
+    @pytest.mark.parametrize("n", [100, 1000])
+    def test_clusters_partition_nodes(self, make_records, make_matches, n):
+        """Test clusters partition the graph and respect the matches."""
+        records = make_records(n)
+        matches = make_matches(records, density=0.002)
+
+        G = build_identity_graph(records, matches)
+        clusters = find_clusters(G)
+
+        all_nodes = [node for cluster in clusters for node in cluster]
+        assert len(all_nodes) == G.number_of_nodes() == n
+        assert len(set(all_nodes)) == len(all_nodes)
+        assert len(clusters) == nx.number_connected_components(G)
+
+        # Matched records always land in the same cluster
+        cluster_of = {node: i for i, cluster in enumerate(clusters) for node in cluster}
+        for id1, id2, _ in matches:
+            assert cluster_of[id1] == cluster_of[id2]
+
+    def test_edge_count_tracks_distinct_matches(self, make_records, make_matches):
+        """Test the graph's O(1) edge count equals the deduplicated matches."""
+        records = make_records(1000)
+        matches = make_matches(records, density=0.002)
+
+        G = build_identity_graph(records, matches)
+        assert G.number_of_edges() == len({frozenset(m[:2]) for m in matches})